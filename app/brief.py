@@ -4,7 +4,7 @@ Decision Brief orchestrator — assembles a full brief for a single ticker.
 Workflow:
   1. Resolve ticker → CIK + SIC → sector template (auto-detect or override).
   2. Fetch latest filing metadata for the qualitative engine.
-  3. Run quant, flow, and qualitative engines in parallel via asyncio.gather.
+  3. Run quant, flow, and qualitative engines in parallel in one TaskGroup.
   4. Assemble everything into a DecisionBrief with Pydantic response models.
 """
 
@@ -13,28 +13,35 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Awaitable
 
 from pydantic import BaseModel, Field
 
-from app.config import settings
+from app.config import get_settings
 from app.coverage import DriverCoverageResponse, compute_driver_coverage, coverage_to_response
 from app.data import (
     SIC_TO_SECTOR,
+    FilingRow,
     get_company_filings,
     get_company_submissions,
     get_segment_revenue,
 )
 from app.extraction import supplement_kpis_from_filings
-from app.flow import FlowEngine, FlowOutput
-from app.qualitative import QualitativeEngine, RedFlagReport
+from app.engines import get_flow_engine, get_qualitative_engine, get_quant_engine
+from app.flow import FlowOutput
+from app.qualitative import RedFlagReport
 from app.quant import QuantEngine, QuantOutput
 from app.templates import SECTOR_TEMPLATES, SectorTemplate, get_template
 
 logger = logging.getLogger(__name__)
 
 
+def utc_now_iso() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SSZ``."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Pydantic response models — serializable mirrors of engine dataclasses
 # ═══════════════════════════════════════════════════════════════════════════
@@ -226,12 +233,16 @@ class DecisionBriefResponse(BaseModel):
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Serialization helpers — convert engine dataclasses → Pydantic models
+#
+# Engine dataclasses are already schema-correct, so the helpers build response
+# models via model_construct() and skip Pydantic's per-field validation.  The
+# API layer serializes the finished brief straight to JSON (see main.py).
 # ═══════════════════════════════════════════════════════════════════════════
 
 
 def _src(source) -> SourceMetaResponse:
     """Convert a SourceMeta dataclass to its response model."""
-    return SourceMetaResponse(
+    return SourceMetaResponse.model_construct(
         source_type=source.source_type,
         filer=source.filer,
         filing_date=str(source.filing_date) if source.filing_date else None,
@@ -243,16 +254,16 @@ def _src(source) -> SourceMetaResponse:
 
 
 def _serialize_ev(ev) -> EVBuildResponse:
-    return EVBuildResponse(
-        market_cap=EVComponentResponse(
+    return EVBuildResponse.model_construct(
+        market_cap=EVComponentResponse.model_construct(
             label=ev.market_cap.label, value=ev.market_cap.value,
             computation=ev.market_cap.computation, source=_src(ev.market_cap.source),
         ),
-        total_debt=EVComponentResponse(
+        total_debt=EVComponentResponse.model_construct(
             label=ev.total_debt.label, value=ev.total_debt.value,
             computation=ev.total_debt.computation, source=_src(ev.total_debt.source),
         ),
-        cash=EVComponentResponse(
+        cash=EVComponentResponse.model_construct(
             label=ev.cash.label, value=ev.cash.value,
             computation=ev.cash.computation, source=_src(ev.cash.source),
         ),
@@ -271,7 +282,7 @@ def _nan_safe(v: float) -> float | None:
 def _serialize_implied(mi) -> MarketImpliedResponse | None:
     # If implied growth is NaN (no solution), still return the build info
     # but null out the unsolvable fields
-    return MarketImpliedResponse(
+    return MarketImpliedResponse.model_construct(
         implied_fcf_growth_10yr=_nan_safe(mi.implied_fcf_growth_10yr),
         wacc=mi.wacc,
         wacc_build=mi.wacc_build,
@@ -294,29 +305,28 @@ def _serialize_implied(mi) -> MarketImpliedResponse | None:
 
 
 def _serialize_kpis(kpis: dict, template: SectorTemplate) -> list[KPIResponse]:
-    # Build family lookup from template
-    family_map = {k.id: k.kpi_family for k in template.primary_kpis}
-    out = []
-    for kpi in kpis.values():
-        out.append(KPIResponse(
+    # Hoist per-row lookups out of the loop
+    family_of = template.kpi_family_map.get
+    kpi_model = KPIResponse.model_construct
+    trend_model = TrendPointResponse.model_construct
+    out = [None] * len(kpis)
+    for i, kpi in enumerate(kpis.values()):
+        out[i] = kpi_model(
             kpi_id=kpi.kpi_id, label=kpi.label, value=kpi.value, unit=kpi.unit,
-            period=kpi.period, kpi_family=family_map.get(kpi.kpi_id, "lagging"),
+            period=kpi.period, kpi_family=family_of(kpi.kpi_id, "lagging"),
             prior_value=kpi.prior_value, yoy_delta=kpi.yoy_delta,
             qoq_value=kpi.qoq_value, qoq_prior=kpi.qoq_prior,
             qoq_delta=kpi.qoq_delta, qoq_period=kpi.qoq_period,
-            trend=[
-                TrendPointResponse(period=tp.period, value=tp.value)
-                for tp in kpi.trend
-            ],
+            trend=[trend_model(period=tp.period, value=tp.value) for tp in kpi.trend],
             source=_src(kpi.source) if kpi.source else None,
             computation=kpi.computation, note=kpi.note,
-        ))
+        )
     return out
 
 
 def _serialize_scores(scores: dict) -> list[ScoreResponse]:
     return [
-        ScoreResponse(
+        ScoreResponse.model_construct(
             name=s.name, value=s.value, interpretation=s.interpretation,
             components=s.components, source_periods=s.source_periods,
         )
@@ -325,45 +335,51 @@ def _serialize_scores(scores: dict) -> list[ScoreResponse]:
 
 
 def _serialize_holder_map(hm) -> HolderMapResponse:
-    return HolderMapResponse(
-        top_holders=[
-            HolderEntryResponse(
-                filer_name=h.filer_name, form_type=h.form_type,
-                filing_date=h.filing_date, accession_number=h.accession_number,
-                shares=h.shares, value=h.value, fund_type=h.fund_type,
-            )
-            for h in hm.top_holders
-        ],
+    holder_model = HolderEntryResponse.model_construct
+    txn_model = InsiderTransactionResponse.model_construct
+    top_holders = [
+        holder_model(
+            filer_name=h.filer_name, form_type=h.form_type,
+            filing_date=h.filing_date, accession_number=h.accession_number,
+            shares=h.shares, value=h.value, fund_type=h.fund_type,
+        )
+        for h in hm.top_holders
+    ]
+    insider_activity = [
+        txn_model(
+            owner_name=t.owner_name, owner_title=t.owner_title,
+            transaction_date=t.transaction_date, transaction_type=t.transaction_type,
+            shares=t.shares, price_per_share=t.price_per_share,
+            value=t.value, shares_owned_after=t.shares_owned_after,
+            is_10b5_1=t.is_10b5_1, is_discretionary=t.is_discretionary,
+            pct_of_holdings=t.pct_of_holdings, is_notable=t.is_notable,
+            context_note=t.context_note, source=_src(t.source),
+            transaction_count=t.transaction_count,
+        )
+        for t in hm.insider_activity
+    ]
+    return HolderMapResponse.model_construct(
+        top_holders=top_holders,
         holder_count=hm.holder_count,
-        insider_activity=[
-            InsiderTransactionResponse(
-                owner_name=t.owner_name, owner_title=t.owner_title,
-                transaction_date=t.transaction_date, transaction_type=t.transaction_type,
-                shares=t.shares, price_per_share=t.price_per_share,
-                value=t.value, shares_owned_after=t.shares_owned_after,
-                is_10b5_1=t.is_10b5_1, is_discretionary=t.is_discretionary,
-                pct_of_holdings=t.pct_of_holdings, is_notable=t.is_notable,
-                context_note=t.context_note, source=_src(t.source),
-                transaction_count=getattr(t, "transaction_count", 1),
-            )
-            for t in hm.insider_activity
-        ],
+        insider_activity=insider_activity,
         insider_summary=hm.insider_summary,
         data_freshness=hm.data_freshness,
-        holder_data_note=getattr(hm, "holder_data_note", ""),
+        holder_data_note=hm.holder_data_note,
     )
 
 
 def _serialize_red_flags(rf: RedFlagReport) -> RedFlagReportResponse:
-    return RedFlagReportResponse(
-        red_flags=[
-            RedFlagResponse(
-                flag=f.flag, severity=f.severity, section=f.section,
-                page=f.page, page_unverified=f.page_unverified,
-                evidence=f.evidence, context=f.context, source=_src(f.source),
-            )
-            for f in rf.red_flags
-        ],
+    flag_model = RedFlagResponse.model_construct
+    red_flags = [
+        flag_model(
+            flag=f.flag, severity=f.severity, section=f.section,
+            page=f.page, page_unverified=f.page_unverified,
+            evidence=f.evidence, context=f.context, source=_src(f.source),
+        )
+        for f in rf.red_flags
+    ]
+    return RedFlagReportResponse.model_construct(
+        red_flags=red_flags,
         clean_areas=rf.clean_areas,
         filing_source=_src(rf.filing_source),
     )
@@ -374,16 +390,19 @@ def _serialize_red_flags(rf: RedFlagReport) -> RedFlagReportResponse:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-async def detect_sector(ticker: str) -> tuple[str, SectorTemplate, dict]:
+async def detect_sector(
+    ticker: str,
+    sub_meta: dict | None = None,
+) -> tuple[str, SectorTemplate, dict]:
     """
     Resolve ticker → SIC code → sector template.
 
     Returns (sector_key, template, submission_metadata).
     Falls back to the "general" template when the SIC code has no
-    specialized mapping.
+    specialized mapping.  Pass ``sub_meta`` when the caller already holds
+    the submissions metadata to skip the lookup entirely.
     """
-    sub = await get_company_submissions(ticker)
-    meta = sub.data
+    meta = sub_meta if sub_meta is not None else (await get_company_submissions(ticker)).data
     sector_key = meta.get("sector_key")
 
     if sector_key is None:
@@ -401,6 +420,14 @@ async def detect_sector(ticker: str) -> tuple[str, SectorTemplate, dict]:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+async def _capture(coro: Awaitable[Any]) -> Any:
+    """Await *coro*, returning its exception instead of raising it."""
+    try:
+        return await coro
+    except Exception as exc:
+        return exc
+
+
 async def generate_brief(
     ticker: str,
     sector_override: str | None = None,
@@ -416,18 +443,17 @@ async def generate_brief(
     ticker = ticker.upper()
 
     # --- 1. Sector resolution ---
+    sub_meta = (await get_company_submissions(ticker)).data
     if sector_override:
         template = get_template(sector_override)
         sector_key = sector_override
-        sub_result = await get_company_submissions(ticker)
-        sub_meta = sub_result.data
     else:
-        sector_key, template, sub_meta = await detect_sector(ticker)
+        sector_key, template, _ = await detect_sector(ticker, sub_meta)
 
     cik = sub_meta["cik"]
 
     # --- 2. Fetch latest filing metadata (for qualitative engine) ---
-    filing_meta: dict | None = None
+    filing_meta: FilingRow | None = None
     try:
         filings_result = await get_company_filings(
             ticker, form_types=["10-K", "10-K/A"], limit=1,
@@ -438,8 +464,8 @@ async def generate_brief(
         logger.warning("Failed to fetch filing metadata for %s: %s", ticker, exc)
 
     # --- 3. Run engines in parallel ---
-    quant_engine = QuantEngine()
-    flow_engine = FlowEngine()
+    quant_engine = get_quant_engine()
+    flow_engine = get_flow_engine()
 
     # Build tasks — quant and flow always run
     quant_task = quant_engine.analyze(ticker, template)
@@ -447,14 +473,14 @@ async def generate_brief(
 
     # Qualitative only runs if we have a filing AND an API key
     qual_task: asyncio.Task | None = None
-    if filing_meta and settings.anthropic_api_key:
+    if filing_meta and get_settings().anthropic_api_key:
         try:
-            qual_engine = QualitativeEngine()
+            qual_engine = get_qualitative_engine()
             qual_task = qual_engine.detect_red_flags(
                 ticker,
                 template,
-                filing_meta["form_type"],
-                filing_meta["accession_number"],
+                filing_meta.form_type,
+                filing_meta.accession_number,
                 cik,
             )
         except ValueError:
@@ -463,19 +489,16 @@ async def generate_brief(
     # Segment revenue runs in parallel with everything else
     segment_task = get_segment_revenue(ticker)
 
-    # Gather — all engines run concurrently
-    if qual_task:
-        quant_out, flow_out, red_flag_out, segment_result = await asyncio.gather(
-            quant_task, flow_task, qual_task, segment_task,
-            return_exceptions=True,
-        )
-    else:
-        results = await asyncio.gather(
-            quant_task, flow_task, segment_task,
-            return_exceptions=True,
-        )
-        quant_out, flow_out, segment_result = results
-        red_flag_out = None
+    # Run all engines concurrently — failures come back as values so the
+    # per-engine handling below decides which ones are fatal
+    async with asyncio.TaskGroup() as tg:
+        quant_t = tg.create_task(_capture(quant_task))
+        flow_t = tg.create_task(_capture(flow_task))
+        segment_t = tg.create_task(_capture(segment_task))
+        qual_t = tg.create_task(_capture(qual_task)) if qual_task else None
+
+    quant_out, flow_out, segment_result = quant_t.result(), flow_t.result(), segment_t.result()
+    red_flag_out = qual_t.result() if qual_t else None
 
     # Handle engine failures gracefully
     if isinstance(quant_out, Exception):
@@ -496,7 +519,7 @@ async def generate_brief(
         logger.warning("Segment revenue failed for %s: %s", ticker, segment_result)
     elif hasattr(segment_result, "data") and segment_result.data:
         segment_data = [
-            SegmentResponse(
+            SegmentResponse.model_construct(
                 name=s["name"], revenue=s["revenue"],
                 pct_of_total=s["pct_of_total"],
                 yoy_growth=s.get("yoy_growth"),
@@ -520,10 +543,10 @@ async def generate_brief(
     if isinstance(flow_out, FlowOutput):
         freshness.update(flow_out.holder_map.data_freshness)
     if filing_meta:
-        freshness["filing_analyzed"] = filing_meta.get("filing_date", "unknown")
-        freshness["filing_type"] = filing_meta.get("form_type", "unknown")
+        freshness["filing_analyzed"] = filing_meta.filing_date or "unknown"
+        freshness["filing_type"] = filing_meta.form_type or "unknown"
 
-    model_inputs = ModelInputsResponse(
+    model_inputs = ModelInputsResponse.model_construct(
         wacc=quant_out.market_implied.wacc if quant_out.market_implied else None,
         risk_free_rate=(
             quant_out.market_implied.wacc - QuantEngine.BETA * QuantEngine.ERP
@@ -533,17 +556,17 @@ async def generate_brief(
         equity_risk_premium=QuantEngine.ERP,
         terminal_growth=QuantEngine.TERMINAL_GROWTH,
         sector_template=sector_key,
-        filing_used=filing_meta.get("accession_number") if filing_meta else None,
-        filing_date=filing_meta.get("filing_date") if filing_meta else None,
+        filing_used=filing_meta.accession_number if filing_meta else None,
+        filing_date=filing_meta.filing_date if filing_meta else None,
         data_freshness=freshness,
     )
 
-    return DecisionBriefResponse(
+    return DecisionBriefResponse.model_construct(
         ticker=ticker,
         entity_name=quant_out.entity_name,
         sector=sector_key,
         sector_display_name=template.display_name,
-        generated_at=datetime.utcnow().isoformat() + "Z",
+        generated_at=utc_now_iso(),
         ev_build=_serialize_ev(quant_out.ev_build),
         market_implied=(
             _serialize_implied(quant_out.market_implied)
@@ -12,18 +12,35 @@ The ChangeEvent table exists for future scheduled persistence.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import uuid
-from datetime import date, datetime
+from dataclasses import asdict
+from datetime import date
+from operator import attrgetter
 from typing import Any
 
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.data import get_company_filings, get_insider_details
+from app import crud
+from app.brief import detect_sector, utc_now_iso
+from app.data import get_company_filings, get_company_submissions, get_insider_details
+from app.engines import get_quant_engine
+from app.thesis import _evaluate_kill_criterion
 
 logger = logging.getLogger(__name__)
 
+# Event ids are synthetic and never persisted — a random per-process prefix
+# plus a counter keeps them unique without an os.urandom call per event.
+_EVENT_ID_PREFIX = uuid.uuid4().hex[:12]
+_event_seq = itertools.count()
+
+
+def _next_event_id() -> str:
+    return f"{_EVENT_ID_PREFIX}-{next(_event_seq)}"
+
 
 # ---------------------------------------------------------------------------
 # Response models
@@ -73,37 +90,60 @@ async def detect_changes(
     """
     ticker = ticker.upper()
     since_str = since_date.isoformat()
-    events: list[ChangeEventResponse] = []
-
-    # 1. New filings
-    filing_events = await _check_new_filings(ticker, since_str)
-    events.extend(filing_events)
+    # One wall-clock reading per pass, shared by checked_at and KPI events
+    now_iso = utc_now_iso()
 
-    # 2. Insider transactions
-    insider_events = await _check_insider_transactions(ticker, since_str)
-    events.extend(insider_events)
-
-    # 3. KPI threshold proximity (only if DB session available)
+    # The three checks hit disjoint sources (EDGAR filings, Form 4s, DB +
+    # quant engine), so run them concurrently.  KPI threshold proximity
+    # needs a DB session and is skipped without one.
     if session is not None:
-        kpi_events = await _check_kpi_thresholds(ticker, session)
-        events.extend(kpi_events)
+        # Submissions back the filing and Form 4 checks too, so fetching them
+        # up front costs no extra round-trip and lets the KPI check resolve
+        # the sector without a second lookup
+        try:
+            sub_meta = (await get_company_submissions(ticker)).data
+        except Exception as exc:
+            logger.warning("Submissions fetch failed for %s: %s", ticker, exc)
+            sub_meta = None
+        kpi_check = _check_kpi_thresholds(ticker, session, sub_meta, now_iso)
+    else:
+        kpi_check = _no_events()
+    results = await asyncio.gather(
+        _check_new_filings(ticker, since_str),
+        _check_insider_transactions(ticker, since_str),
+        kpi_check,
+        return_exceptions=True,
+    )
+
+    events: list[ChangeEventResponse] = []
+    for check, result in zip(("filings", "insider", "kpi_thresholds"), results):
+        if isinstance(result, Exception):
+            logger.warning("Change check '%s' failed for %s: %s", check, ticker, result)
+            continue
+        events.extend(result)
 
     # Sort by timestamp descending (most recent first)
-    events.sort(key=lambda e: e.timestamp, reverse=True)
+    events.sort(key=attrgetter("timestamp"), reverse=True)
 
     return ChangeFeedResponse(
         ticker=ticker,
         since=since_str,
         events=events,
         event_count=len(events),
-        checked_at=datetime.utcnow().isoformat() + "Z",
+        checked_at=now_iso,
     )
 
 
+async def _no_events() -> list[ChangeEventResponse]:
+    return []
+
+
 # ---------------------------------------------------------------------------
 # Check 1: New SEC filings
 # ---------------------------------------------------------------------------
 
+_WATCH_FORMS = frozenset({"10-K", "10-K/A", "10-Q", "10-Q/A", "8-K", "8-K/A"})
+
 
 async def _check_new_filings(
     ticker: str,
@@ -111,27 +151,25 @@ async def _check_new_filings(
 ) -> list[ChangeEventResponse]:
     """Find filings with filing_date >= since_str."""
     events: list[ChangeEventResponse] = []
+    _new_id = _next_event_id
+    _event = ChangeEventResponse.model_construct
 
     try:
         result = await get_company_filings(ticker, form_types=None, limit=40)
 
         for filing in result.data:
-            filing_date = filing.get("filing_date", "")
+            filing_date = filing.filing_date
             if filing_date < since_str:
-                continue
+                break  # EDGAR returns filings newest-first — the rest are older
 
-            form_type = filing.get("form_type", "unknown")
+            form_type = filing.form_type
 
-            # Skip filing types that are noise (e.g. EFFECT, SC 13G/A amendments)
-            # Focus on substantive filings
-            severity = "info"
-            if form_type in ("10-K", "10-K/A", "10-Q", "10-Q/A"):
-                severity = "watch"
-            elif form_type in ("8-K", "8-K/A"):
-                severity = "watch"
+            # Periodic reports and 8-Ks are substantive; everything else
+            # (e.g. EFFECT, SC 13G/A amendments) is informational noise
+            severity = "watch" if form_type in _WATCH_FORMS else "info"
 
-            events.append(ChangeEventResponse(
-                id=str(uuid.uuid4()),
+            events.append(_event(
+                id=_new_id(),
                 ticker=ticker,
                 timestamp=f"{filing_date}T00:00:00Z",
                 severity=severity,
@@ -139,11 +177,11 @@ async def _check_new_filings(
                 what_changed=f"New {form_type} filed on {filing_date}",
                 source={
                     "source_type": form_type,
-                    "accession_number": filing.get("accession_number"),
-                    "url": filing.get("url", ""),
+                    "accession_number": filing.accession_number,
+                    "url": filing.url,
                     "filing_date": filing_date,
                 },
-                raw_data=filing,
+                raw_data=asdict(filing),
             ))
     except Exception as exc:
         logger.warning("Failed to check filings for %s: %s", ticker, exc)
@@ -172,12 +210,17 @@ async def _check_insider_transactions(
 ) -> list[ChangeEventResponse]:
     """Find insider transactions with transaction_date >= since_str."""
     events: list[ChangeEventResponse] = []
+    _new_id = _next_event_id
+    _event = ChangeEventResponse.model_construct
+    _action_for = _TXN_CODE_MAP.get
 
     try:
         result = await get_insider_details(ticker, limit=20)
 
         for txn in result.data:
             txn_date = txn.get("transaction_date", "")
+            # Transaction dates aren't monotonic across Form 4s (late filings,
+            # multi-day reports), so filter rather than stop at the cutoff
             if not txn_date or txn_date < since_str:
                 continue
 
@@ -188,27 +231,26 @@ async def _check_insider_transactions(
             value = txn.get("value")
             is_10b5_1 = txn.get("is_10b5_1", False)
 
-            action = _TXN_CODE_MAP.get(code, f"transacted ({code})")
+            action = _action_for(code) or f"transacted ({code})"
             shares_str = f"{shares:,.0f} shares" if shares else "shares"
             value_str = f" (${value:,.0f})" if value else ""
             plan_str = " [10b5-1 plan]" if is_10b5_1 else ""
+            what_changed = f"{owner} ({title}) {action} {shares_str}{value_str}{plan_str}"
 
-            # Severity: discretionary purchases are notable
-            severity = "info"
-            if code == "P" and not is_10b5_1:
-                severity = "watch"
-            elif code == "S" and not is_10b5_1 and value and value > 500_000:
-                severity = "watch"
+            # Severity: discretionary purchases, and discretionary sales over
+            # $500k, are notable
+            notable = not is_10b5_1 and (
+                code == "P" or (code == "S" and (value or 0) > 500_000)
+            )
+            severity = "watch" if notable else "info"
 
-            events.append(ChangeEventResponse(
-                id=str(uuid.uuid4()),
+            events.append(_event(
+                id=_new_id(),
                 ticker=ticker,
                 timestamp=f"{txn_date}T00:00:00Z",
                 severity=severity,
                 event_type="insider_transaction",
-                what_changed=(
-                    f"{owner} ({title}) {action} {shares_str}{value_str}{plan_str}"
-                ),
+                what_changed=what_changed,
                 source={
                     "source_type": "form4",
                     "filer": owner,
@@ -231,17 +273,19 @@ async def _check_insider_transactions(
 async def _check_kpi_thresholds(
     ticker: str,
     session: AsyncSession,
+    sub_meta: dict | None = None,
+    now_iso: str | None = None,
 ) -> list[ChangeEventResponse]:
     """
     If user has an active thesis (status='monitoring') for this ticker,
     run QuantEngine to get fresh KPIs and compare to kill criteria thresholds.
+    ``sub_meta`` is pre-fetched submissions metadata for detect_sector.
     """
-    from app import crud
-    from app.brief import detect_sector
-    from app.quant import QuantEngine
-    from app.thesis import _evaluate_kill_criterion
-
+    if now_iso is None:
+        now_iso = utc_now_iso()
     events: list[ChangeEventResponse] = []
+    _new_id = _next_event_id
+    _event = ChangeEventResponse.model_construct
 
     # Find active theses for this ticker
     active = await crud.list_theses(session, ticker=ticker, status="monitoring", limit=5)
@@ -250,43 +294,38 @@ async def _check_kpi_thresholds(
 
     # Run quant engine for fresh KPIs
     try:
-        _, template, _ = await detect_sector(ticker)
-        quant = QuantEngine()
-        quant_output = await quant.analyze(ticker, template)
+        _, template, _ = await detect_sector(ticker, sub_meta)
+        quant_output = await get_quant_engine().analyze(ticker, template)
     except Exception as exc:
         logger.warning("Quant engine failed for KPI check on %s: %s", ticker, exc)
         return events
 
     # For each active thesis, check kill criteria against fresh KPIs
-    for thesis_summary in active:
-        thesis = await crud.get_thesis(session, thesis_summary.id)
-        if thesis is None:
-            continue
-
+    theses = await crud.get_theses_by_ids(session, [t.id for t in active])
+    for thesis in theses:
         for kc in thesis.kill_criteria:
             kpi_data = quant_output.sector_kpis.get(kc.metric)
             if kpi_data is None or kpi_data.value is None:
                 continue
 
             fresh_value = kpi_data.value
-            status, distance = _evaluate_kill_criterion(
-                fresh_value, float(kc.threshold), kc.operator,
-            )
+            threshold = float(kc.threshold)
+            status, distance = _evaluate_kill_criterion(fresh_value, threshold, kc.operator)
 
             if status in ("watch", "breach"):
                 old_status = kc.status or "ok"
                 status_change = f"{old_status} -> {status}" if old_status != status else None
 
-                events.append(ChangeEventResponse(
-                    id=str(uuid.uuid4()),
+                events.append(_event(
+                    id=_new_id(),
                     ticker=ticker,
-                    timestamp=datetime.utcnow().isoformat() + "Z",
+                    timestamp=now_iso,
                     severity=status,
                     event_type="kpi_threshold",
                     what_changed=(
                         f"Kill criterion '{kc.description}': "
                         f"{kc.metric} is {fresh_value:.2f} "
-                        f"(threshold: {kc.operator} {float(kc.threshold):.2f}, "
+                        f"(threshold: {kc.operator} {threshold:.2f}, "
                         f"distance: {distance:.1f}%)"
                     ),
                     source={
@@ -299,7 +338,7 @@ async def _check_kpi_thresholds(
                     raw_data={
                         "kill_criterion_id": kc.id,
                         "metric": kc.metric,
-                        "threshold": float(kc.threshold),
+                        "threshold": threshold,
                         "operator": kc.operator,
                         "current_value": fresh_value,
                         "prior_status": old_status,
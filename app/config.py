@@ -1,5 +1,7 @@
 """Application settings — reads from .env or environment variables."""
 
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -12,6 +14,9 @@ class Settings(BaseSettings):
     postgres_db: str = "thesis_os"
     postgres_host: str = "localhost"
     postgres_port: int = 5432
+    # Per-process connection pool (pool_size + max_overflow caps connections)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
 
     # Anthropic
     anthropic_api_key: str = ""
@@ -25,12 +30,26 @@ class Settings(BaseSettings):
     # OpenBB
     openbb_token: str = ""
 
-    @property
+    # Comma-separated tickers whose SEC data is prefetched at startup
+    watchlist: str = ""
+
+    @cached_property
     def database_url(self) -> str:
+        # Settings are never mutated after load, so the DSN is built once
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings on first use, so importing this module reads no .env."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keeps ``app.config.settings`` working without instantiating at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
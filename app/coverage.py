@@ -8,8 +8,10 @@ reasons, and supporting artifact IDs.
 
 from __future__ import annotations
 
-import types
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from pydantic import BaseModel
 
@@ -19,14 +21,14 @@ from pydantic import BaseModel
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionCoverage:
     status: str  # "covered" | "partial" | "missing"
     reasons: list[str] = field(default_factory=list)
     supporting_artifacts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DriverCoverage:
     revenue_drivers: DimensionCoverage = field(default_factory=lambda: DimensionCoverage(status="missing"))
     retention: DimensionCoverage = field(default_factory=lambda: DimensionCoverage(status="missing"))
@@ -36,6 +38,25 @@ class DriverCoverage:
     score: int = 0
 
 
+@dataclass(slots=True, frozen=True)
+class _KpiShim:
+    """KPI-shaped stand-in built from a stored Claim row."""
+    kpi_id: str
+    label: str
+    value: float | None
+    unit: str
+    period: str
+    yoy_delta: float | None
+    qoq_delta: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class _ClaimShim:
+    """Claim-shaped stand-in for the competition dimension."""
+    kpi_id: str
+    kpi_family: str | None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Pydantic response models (used by API layer)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -60,16 +81,22 @@ class DriverCoverageResponse(BaseModel):
 # KPI → dimension mapping
 # ═══════════════════════════════════════════════════════════════════════════
 
-COVERAGE_MAP: dict[str, list[str]] = {
-    "revenue_drivers": ["revenue_growth", "rpo_growth", "deferred_rev_growth"],
-    "retention": ["nrr", "deferred_rev_growth"],
-    "pricing": ["subscription_mix", "gross_margin"],
-    "margin": ["operating_margin", "r_and_d_intensity", "sm_revenue", "fcf_margin"],
-    "competition": [],  # special: claims-aware (thesis) or leading-KPI-presence (brief)
-}
+COVERAGE_MAP: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "revenue_drivers": ("revenue_growth", "rpo_growth", "deferred_rev_growth"),
+    "retention": ("nrr", "deferred_rev_growth"),
+    "pricing": ("subscription_mix", "gross_margin"),
+    "margin": ("operating_margin", "r_and_d_intensity", "sm_revenue", "fcf_margin"),
+    "competition": (),  # special: claims-aware (thesis) or leading-KPI-presence (brief)
+})
+
+# Leading KPIs used as a proxy for competition coverage in brief mode.
+# A tuple rather than a set: its order is the order reported to the user.
+_LEADING_KPIS = ("rpo_growth", "deferred_rev_growth", "nrr", "backlog", "book_to_bill")
 
-# Leading KPIs used as a proxy for competition coverage in brief mode
-_LEADING_KPIS = ["rpo_growth", "deferred_rev_growth", "nrr", "backlog", "book_to_bill"]
+# KPI-backed dimensions, frozen once at import (competition is handled separately)
+_COVERAGE_ITEMS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (dim, ids) for dim, ids in COVERAGE_MAP.items() if dim != "competition"
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -77,23 +104,28 @@ _LEADING_KPIS = ["rpo_growth", "deferred_rev_growth", "nrr", "backlog", "book_to
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _fmt_dollars(val: float) -> str:
+    if abs(val) >= 1e9:
+        return f"${val / 1e9:.1f}B"
+    if abs(val) >= 1e6:
+        return f"${val / 1e6:.1f}M"
+    return f"${val:,.0f}"
+
+
+_UNIT_FORMATTERS: dict[str, Callable[[float], str]] = {
+    "%": lambda v: f"{v:.1f}%",
+    "$": _fmt_dollars,
+    "x": lambda v: f"{v:.1f}x",
+    "days": lambda v: f"{v:.0f} days",
+}
+
+
 def _fmt_value(val: float | None, unit: str) -> str:
     """Format a KPI value for human display."""
     if val is None:
         return "N/A"
-    if unit == "%":
-        return f"{val:.1f}%"
-    if unit == "$":
-        if abs(val) >= 1e9:
-            return f"${val / 1e9:.1f}B"
-        if abs(val) >= 1e6:
-            return f"${val / 1e6:.1f}M"
-        return f"${val:,.0f}"
-    if unit == "x":
-        return f"{val:.1f}x"
-    if unit == "days":
-        return f"{val:.0f} days"
-    return f"{val:.2f}{unit}"
+    fmt = _UNIT_FORMATTERS.get(unit)
+    return fmt(val) if fmt is not None else f"{val:.2f}{unit}"
 
 
 def _fmt_delta(delta: float | None) -> str:
@@ -113,14 +145,17 @@ def compute_driver_coverage(
     Parameters
     ----------
     kpis : dict[str, KPIResult]
-        Sector KPI results (from QuantOutput or duck-typed SimpleNamespace).
+        Sector KPI results (from QuantOutput or duck-typed _KpiShim).
     claims : list[CompiledClaim] | None
         If provided (thesis context), used for competition dimension.
         If None (brief context), falls back to leading-KPI presence.
     """
     coverage = DriverCoverage()
 
-    def _evaluate_dimension(dim_name: str, kpi_ids: list[str]) -> DimensionCoverage:
+    def _evaluate_dimension(kpi_ids: tuple[str, ...]) -> DimensionCoverage:
+        if not kpi_ids:
+            return DimensionCoverage(status="missing")
+
         reasons: list[str] = []
         artifacts: list[str] = []
 
@@ -154,10 +189,8 @@ def compute_driver_coverage(
 
         return DimensionCoverage(status=status, reasons=reasons, supporting_artifacts=artifacts)
 
-    coverage.revenue_drivers = _evaluate_dimension("revenue_drivers", COVERAGE_MAP["revenue_drivers"])
-    coverage.retention = _evaluate_dimension("retention", COVERAGE_MAP["retention"])
-    coverage.pricing = _evaluate_dimension("pricing", COVERAGE_MAP["pricing"])
-    coverage.margin = _evaluate_dimension("margin", COVERAGE_MAP["margin"])
+    for dim_name, kpi_ids in _COVERAGE_ITEMS:
+        setattr(coverage, dim_name, _evaluate_dimension(kpi_ids))
 
     # Competition dimension — context-dependent
     if claims is not None:
@@ -182,7 +215,7 @@ def compute_driver_coverage(
         # Brief mode: check if any leading KPIs have data
         leading_with_data = [
             kid for kid in _LEADING_KPIS
-            if kid in kpis and getattr(kpis[kid], "value", None) is not None
+            if (k := kpis.get(kid)) is not None and getattr(k, "value", None) is not None
         ]
         if leading_with_data:
             coverage.competition = DimensionCoverage(
@@ -212,43 +245,20 @@ def compute_driver_coverage(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _dim_to_response(dim: DimensionCoverage) -> DimensionCoverageResponse:
-    return DimensionCoverageResponse(
-        status=dim.status,
-        reasons=dim.reasons,
-        supporting_artifacts=dim.supporting_artifacts,
-    )
-
-
 def coverage_to_response(cov: DriverCoverage) -> DriverCoverageResponse:
     """Convert a DriverCoverage dataclass to its Pydantic response model."""
-    return DriverCoverageResponse(
-        revenue_drivers=_dim_to_response(cov.revenue_drivers),
-        retention=_dim_to_response(cov.retention),
-        pricing=_dim_to_response(cov.pricing),
-        margin=_dim_to_response(cov.margin),
-        competition=_dim_to_response(cov.competition),
-        score=cov.score,
-    )
+    # Validated straight off the dataclass attributes (nested dimensions
+    # included) in pydantic-core — no intermediate dict
+    return DriverCoverageResponse.model_validate(cov, from_attributes=True)
 
 
 def coverage_to_dict(cov: DriverCoverage) -> dict:
     """Convert a DriverCoverage dataclass to a plain dict (for _draft_to_dict)."""
-    def _dim(d: DimensionCoverage) -> dict:
-        return {
-            "status": d.status,
-            "reasons": d.reasons,
-            "supporting_artifacts": d.supporting_artifacts,
-        }
-
-    return {
-        "revenue_drivers": _dim(cov.revenue_drivers),
-        "retention": _dim(cov.retention),
-        "pricing": _dim(cov.pricing),
-        "margin": _dim(cov.margin),
-        "competition": _dim(cov.competition),
-        "score": cov.score,
-    }
+    return asdict(cov)
+
+
+def _opt_float(v) -> float | None:
+    return float(v) if v is not None else None
 
 
 def compute_coverage_from_claims(claims: list) -> DriverCoverageResponse:
@@ -256,27 +266,49 @@ def compute_coverage_from_claims(claims: list) -> DriverCoverageResponse:
     Compute coverage from stored Claim ORM objects (for GET /thesis/{id}).
 
     Builds a minimal KPI-like dict from Claim fields so we can reuse
-    compute_driver_coverage().
+    compute_driver_coverage().  The computation depends only on the claim
+    fields read here, so it is memoized on a tuple of them — an unchanged
+    thesis is served from cache on repeat reads.  Each call gets its own
+    response model, so callers can't alter the cached result.
     """
-    kpi_dict: dict = {}
-    for c in claims:
-        kpi_id = c.kpi_id
-        if kpi_id not in kpi_dict:
-            kpi_dict[kpi_id] = types.SimpleNamespace(
-                kpi_id=kpi_id,
-                label=kpi_id,
-                value=float(c.current_value) if c.current_value is not None else None,
-                unit="",
-                period="",
-                yoy_delta=float(c.yoy_delta) if c.yoy_delta is not None else None,
-                qoq_delta=float(c.qoq_delta) if c.qoq_delta is not None else None,
-            )
+    fingerprint = tuple(
+        (
+            c.kpi_id,
+            _opt_float(c.current_value),
+            _opt_float(c.yoy_delta),
+            _opt_float(c.qoq_delta),
+            c.kpi_family,
+        )
+        for c in claims
+    )
+    return coverage_to_response(_coverage_from_fingerprint(fingerprint))
+
+
+@lru_cache(maxsize=1024)
+def _coverage_from_fingerprint(
+    fingerprint: tuple[tuple[str, float | None, float | None, float | None, str | None], ...],
+) -> DriverCoverage:
+    # The cached DriverCoverage is never handed out, only converted into a
+    # fresh response model per call.
+    # First claim per KPI wins — built in reverse so later (earlier-listed)
+    # duplicates overwrite, with no separate membership probe
+    kpi_dict: dict = {
+        kpi_id: _KpiShim(
+            kpi_id=kpi_id,
+            label=kpi_id,
+            value=value,
+            unit="",
+            period="",
+            yoy_delta=yoy_delta,
+            qoq_delta=qoq_delta,
+        )
+        for kpi_id, value, yoy_delta, qoq_delta, _ in reversed(fingerprint)
+    }
 
     # Build duck-typed claims for competition dimension
     claim_like = [
-        types.SimpleNamespace(kpi_id=c.kpi_id, kpi_family=c.kpi_family)
-        for c in claims
+        _ClaimShim(kpi_id=kpi_id, kpi_family=kpi_family)
+        for kpi_id, _, _, _, kpi_family in fingerprint
     ]
 
-    cov = compute_driver_coverage(kpi_dict, claims=claim_like)
-    return coverage_to_response(cov)
+    return compute_driver_coverage(kpi_dict, claims=claim_like)
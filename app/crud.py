@@ -7,15 +7,22 @@ Single-user mode (hardcoded user_id) until auth ships.
 from __future__ import annotations
 
 import logging
+import re
 import uuid
-from datetime import date as dt_date, datetime as dt_datetime
+from datetime import date as dt_date, datetime as dt_datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, func, insert, select, tuple_, update
 from sqlalchemy.orm import selectinload
 
 from app.db import Catalyst, Claim, KillCriterion, Thesis
-from app.thesis import ThesisDraft
+
+if TYPE_CHECKING:
+    # Annotation-only: app.thesis pulls in the engines and the Anthropic SDK
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.thesis import ThesisDraft
 
 logger = logging.getLogger(__name__)
 
@@ -27,25 +34,32 @@ DEFAULT_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 # ---------------------------------------------------------------------------
 
 
+_QUARTER_RE = re.compile(r"^\s*Q([1-4])\s+(\d{4})\s*$", re.IGNORECASE)
+
+
 def _parse_catalyst_date(date_str: str) -> dt_date:
     """Best-effort parse of catalyst date strings from LLM output."""
+    parsed = _parse_catalyst_date_cached(date_str)
+    if parsed is None:
+        logger.info("Could not parse catalyst date '%s', using today", date_str)
+        return dt_date.today()
+    return parsed
+
+
+@lru_cache(maxsize=512)
+def _parse_catalyst_date_cached(date_str: str) -> dt_date | None:
+    """Pure part of _parse_catalyst_date — LLM output repeats the same strings."""
     for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
         try:
             return dt_datetime.strptime(date_str, fmt).date()
         except ValueError:
             continue
     # Quarter-style: "Q2 2025" → approximate to quarter-end
-    date_str_upper = date_str.upper().strip()
-    if date_str_upper.startswith("Q") and len(date_str_upper) >= 6:
-        try:
-            q = int(date_str_upper[1])
-            year = int(date_str_upper.split()[-1])
-            month = q * 3  # Q1→3, Q2→6, Q3→9, Q4→12
-            return dt_date(year, month, 28)
-        except (ValueError, IndexError):
-            pass
-    logger.info("Could not parse catalyst date '%s', using today", date_str)
-    return dt_date.today()
+    m = _QUARTER_RE.match(date_str)
+    if m:
+        q, year = int(m.group(1)), int(m.group(2))
+        return dt_date(year, q * 3, 28)  # Q1→3, Q2→6, Q3→9, Q4→12
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -85,54 +99,67 @@ async def save_thesis(
 
     prefix = str(thesis.id)[:8]
 
+    # Child rows are written with one executemany INSERT per table rather
+    # than per-row ORM adds — they are never read back through this session
+    # (callers reload via get_thesis).
+    now = dt_datetime.now(dt_timezone.utc)
+
     # --- Claims ---
-    for c in draft.claims:
-        claim = Claim(
-            id=f"{prefix}-{c.id}",
-            thesis_id=thesis.id,
-            statement=c.statement,
-            kpi_id=c.kpi_id,
-            kpi_family=getattr(c, "kpi_family", "lagging"),
-            current_value=c.current_value,
-            qoq_delta=c.qoq_delta,
-            yoy_delta=c.yoy_delta,
-            status=getattr(c, "status", "supported"),
-            last_updated=dt_datetime.utcnow(),
-        )
-        session.add(claim)
+    claim_rows = [
+        {
+            "id": f"{prefix}-{c.id}",
+            "thesis_id": thesis.id,
+            "statement": c.statement,
+            "kpi_id": c.kpi_id,
+            "kpi_family": getattr(c, "kpi_family", "lagging"),
+            "current_value": c.current_value,
+            "qoq_delta": c.qoq_delta,
+            "yoy_delta": c.yoy_delta,
+            "status": getattr(c, "status", "supported"),
+            "last_updated": now,
+        }
+        for c in draft.claims
+    ]
+    if claim_rows:
+        await session.execute(insert(Claim), claim_rows)
 
     # --- Kill Criteria ---
-    for kc in draft.kill_criteria:
-        criterion = KillCriterion(
-            id=f"{prefix}-{kc.id}",
-            thesis_id=thesis.id,
-            description=kc.description,
-            metric=kc.metric,
-            operator=kc.operator,
-            threshold=kc.threshold,
-            duration=kc.duration,
-            current_value=kc.current_value,
-            status=kc.status,
-            distance_pct=kc.distance_pct,
-            watch_reason=kc.watch_reason,
-            last_updated=dt_datetime.utcnow(),
-        )
-        session.add(criterion)
+    kc_rows = [
+        {
+            "id": f"{prefix}-{kc.id}",
+            "thesis_id": thesis.id,
+            "description": kc.description,
+            "metric": kc.metric,
+            "operator": kc.operator,
+            "threshold": kc.threshold,
+            "duration": kc.duration,
+            "current_value": kc.current_value,
+            "status": kc.status,
+            "distance_pct": kc.distance_pct,
+            "watch_reason": kc.watch_reason,
+            "last_updated": now,
+        }
+        for kc in draft.kill_criteria
+    ]
+    if kc_rows:
+        await session.execute(insert(KillCriterion), kc_rows)
 
     # --- Catalysts ---
-    for cat in draft.catalysts:
-        catalyst = Catalyst(
-            thesis_id=thesis.id,
-            ticker=draft.ticker,
-            event_date=_parse_catalyst_date(cat.expected_date),
-            event=cat.event,
-            claims_tested=cat.claims_tested,
-            kill_criteria_tested=cat.kill_criteria_tested,
-            occurred=False,
-        )
-        session.add(catalyst)
+    catalyst_rows = [
+        {
+            "thesis_id": thesis.id,
+            "ticker": draft.ticker,
+            "event_date": _parse_catalyst_date(cat.expected_date),
+            "event": cat.event,
+            "claims_tested": cat.claims_tested,
+            "kill_criteria_tested": cat.kill_criteria_tested,
+            "occurred": False,
+        }
+        for cat in draft.catalysts
+    ]
+    if catalyst_rows:
+        await session.execute(insert(Catalyst), catalyst_rows)
 
-    await session.flush()
     return thesis
 
 
@@ -156,6 +183,27 @@ async def get_thesis(session: AsyncSession, thesis_id: uuid.UUID) -> Thesis | No
     return result.scalar_one_or_none()
 
 
+async def _get_thesis_status(session: AsyncSession, thesis_id: uuid.UUID) -> str | None:
+    """Fetch just a thesis's status (None if the thesis doesn't exist)."""
+    result = await session.execute(select(Thesis.status).where(Thesis.id == thesis_id))
+    return result.scalar_one_or_none()
+
+
+async def get_theses_by_ids(
+    session: AsyncSession, thesis_ids: list[uuid.UUID],
+) -> list[Thesis]:
+    """Fetch several theses in one query with kill criteria eager-loaded."""
+    if not thesis_ids:
+        return []
+    stmt = (
+        select(Thesis)
+        .where(Thesis.id.in_(thesis_ids))
+        .options(selectinload(Thesis.kill_criteria))
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
 # ---------------------------------------------------------------------------
 # List — filtered listing
 # ---------------------------------------------------------------------------
@@ -167,15 +215,25 @@ async def list_theses(
     status: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    before: tuple[dt_datetime, uuid.UUID] | None = None,
 ) -> list[Thesis]:
-    """List theses with optional filters, ordered by created_at DESC."""
-    stmt = select(Thesis).order_by(Thesis.created_at.desc())
+    """
+    List theses with optional filters, ordered by created_at DESC.
+
+    Pass ``before`` (the last page's final ``(created_at, id)``) for keyset
+    pagination — the id breaks created_at ties, so no row is skipped — it replaces ``offset``, so deep pages cost O(limit)
+    instead of scanning and discarding ``offset`` rows.
+    """
+    stmt = select(Thesis).order_by(Thesis.created_at.desc(), Thesis.id.desc())
     if ticker:
         stmt = stmt.where(Thesis.ticker == ticker.upper())
     if status:
         stmt = stmt.where(Thesis.status == status)
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
+    if before is not None:
+        stmt = stmt.where(tuple_(Thesis.created_at, Thesis.id) < before)
+    else:
+        stmt = stmt.offset(offset)
+    result = await session.execute(stmt.limit(limit))
     return list(result.scalars().all())
 
 
@@ -190,19 +248,32 @@ async def lock_thesis(
     entry_price: float | None = None,
 ) -> Thesis:
     """Transition a thesis from draft to monitoring."""
-    thesis = await get_thesis(session, thesis_id)
+    values: dict = {"status": "monitoring"}
+    if entry_price is not None:
+        # Only record an entry price the first time — SET sees pre-update values
+        values["entry_price"] = func.coalesce(Thesis.entry_price, entry_price)
+        values["entry_date"] = case(
+            (Thesis.entry_price.is_(None), dt_date.today()), else_=Thesis.entry_date,
+        )
+
+    # Guarded UPDATE … RETURNING: the status check and the write are one
+    # round-trip, and a concurrent transition can't be overwritten
+    stmt = (
+        update(Thesis)
+        .where(Thesis.id == thesis_id, Thesis.status == "draft")
+        .values(**values)
+        .returning(Thesis)
+        .execution_options(synchronize_session="fetch")
+    )
+    thesis = (await session.execute(stmt)).scalar_one_or_none()
     if thesis is None:
-        raise ValueError(f"Thesis {thesis_id} not found")
-    if thesis.status != "draft":
+        status = await _get_thesis_status(session, thesis_id)
+        if status is None:
+            raise ValueError(f"Thesis {thesis_id} not found")
         raise ValueError(
-            f"Cannot lock thesis with status '{thesis.status}' — must be 'draft'"
+            f"Cannot lock thesis with status '{status}' — must be 'draft'"
         )
 
-    thesis.status = "monitoring"
-    if entry_price is not None and thesis.entry_price is None:
-        thesis.entry_price = entry_price
-        thesis.entry_date = dt_date.today()
-
     return thesis
 
 
@@ -210,6 +281,8 @@ async def lock_thesis(
 # Close — monitoring/draft → closed
 # ---------------------------------------------------------------------------
 
+_TERMINAL_STATUSES = ("closed", "killed")
+
 
 async def close_thesis(
     session: AsyncSession,
@@ -218,18 +291,28 @@ async def close_thesis(
     close_price: float | None = None,
 ) -> Thesis:
     """Close a thesis with a reason."""
-    thesis = await get_thesis(session, thesis_id)
+    values: dict = {
+        "status": "closed",
+        "close_reason": reason,
+        "close_date": dt_date.today(),
+    }
+    if close_price is not None:
+        values["close_price"] = close_price
+
+    stmt = (
+        update(Thesis)
+        .where(Thesis.id == thesis_id, Thesis.status.not_in(_TERMINAL_STATUSES))
+        .values(**values)
+        .returning(Thesis)
+        .execution_options(synchronize_session="fetch")
+    )
+    thesis = (await session.execute(stmt)).scalar_one_or_none()
     if thesis is None:
-        raise ValueError(f"Thesis {thesis_id} not found")
-    if thesis.status in ("closed", "killed"):
+        status = await _get_thesis_status(session, thesis_id)
+        if status is None:
+            raise ValueError(f"Thesis {thesis_id} not found")
         raise ValueError(
-            f"Thesis already '{thesis.status}' — cannot close again"
+            f"Thesis already '{status}' — cannot close again"
         )
 
-    thesis.status = "closed"
-    thesis.close_reason = reason
-    thesis.close_date = dt_date.today()
-    if close_price is not None:
-        thesis.close_price = close_price
-
     return thesis
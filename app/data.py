@@ -8,18 +8,47 @@ lookups cheap within a session.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
+import heapq
+import importlib.util
+import io
+import json
 import logging
+import os
+import random
 import re
+import time
 import xml.etree.ElementTree as ET
+import zlib
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from functools import lru_cache, partial
+from datetime import date, datetime, timezone
 from html.parser import HTMLParser
-from typing import Any
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Mapping
 
 import httpx
 from cachetools import TTLCache
 
-from app.config import settings
+try:  # optional: ~2-3x faster decoding of multi-MB SEC payloads (companyfacts)
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:  # optional: libxml2 tokenizes multi-MB filing HTML several times faster
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +56,7 @@ logger = logging.getLogger(__name__)
 # Source metadata attached to every data result
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceMeta:
     """Enough info to construct a full Citation in the DB layer."""
 
@@ -41,35 +70,328 @@ class SourceMeta:
     description: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class FilingRow:
+    """One entry from a company's EDGAR filing index."""
+
+    form_type: str
+    filing_date: str  # ISO date
+    accession_number: str
+    primary_document: str
+    url: str
+    cik: str
+
+
+@dataclass(frozen=True, slots=True)
 class DataResult:
-    """Wrapper returned by every data function."""
+    """
+    Wrapper returned by every data function.
+
+    Frozen because cached instances are handed to every caller as-is.
+    """
 
     data: Any
     source: SourceMeta
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    fetched_at: float = field(default_factory=time.time)  # epoch seconds
+
+    @property
+    def fetched_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.fetched_at, tz=timezone.utc)
+
+
+class TickerNotFoundError(ValueError):
+    """The ticker is not in EDGAR's ticker map."""
 
 
 # ---------------------------------------------------------------------------
 # TTL cache — simple in-process cache shared across calls
 # ---------------------------------------------------------------------------
 
-_cache: TTLCache = TTLCache(maxsize=512, ttl=900)  # 15-minute default
+# TTLs are stratified by how fast the underlying data moves
+_cache: TTLCache = TTLCache(maxsize=2048, ttl=900)  # filings index, insider, 13F, prices
+_quote_cache: TTLCache = TTLCache(maxsize=256, ttl=30)  # live quotes
+_fundamentals_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)  # XBRL, estimates, yields
+# Filing documents are immutable by accession, but multi-MB of text — held
+# zlib-compressed (see _pack_filing_text), which shrinks prose ~4-5×
+_filing_cache: TTLCache = TTLCache(maxsize=128, ttl=86_400)
+# ...and behind it on disk, so eviction or a restart costs a file read rather
+# than a multi-MB download and re-parse
+_FILING_DISK_TTL = 30 * 86_400
+# Tombstones for definitive misses (unknown ticker, 404) so a bad ticker
+# can't drive a retry storm against SEC — see _single_flight
+_negative_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+_TICKER_CACHES = (_cache, _quote_cache, _fundamentals_cache, _negative_cache)
+
+
+def _pack_filing_text(result: DataResult) -> tuple[bytes, SourceMeta, float]:
+    return zlib.compress(result.data.encode("utf-8"), 3), result.source, result.fetched_at
+
+
+def _unpack_filing_text(packed: tuple[bytes, SourceMeta, float]) -> DataResult:
+    blob, source, fetched_at = packed
+    return DataResult(
+        data=zlib.decompress(blob).decode("utf-8"), source=source, fetched_at=fetched_at,
+    )
+
+
+def _filing_text_disk_key(accession_number: str) -> str:
+    return f"filing_text|{accession_number}"
+
+
+def _filing_text_to_disk(
+    accession_number: str, packed: tuple[bytes, SourceMeta, float],
+) -> None:
+    blob, source, fetched_at = packed
+    header = _json_dumps({
+        "url": source.url, "description": source.description, "fetched_at": fetched_at,
+    })
+    # One JSON header line, then the already-compressed text as-is
+    _disk_cache_put(
+        _filing_text_disk_key(accession_number), header + b"\n" + blob, suffix=".txt.z",
+    )
+
+
+def _filing_text_from_disk(
+    accession_number: str, cik: str,
+) -> tuple[bytes, SourceMeta, float] | None:
+    content = _disk_cache_get(
+        _filing_text_disk_key(accession_number), _FILING_DISK_TTL, suffix=".txt.z",
+    )
+    if content is None:
+        return None
+    header, _, blob = content.partition(b"\n")
+    meta = _json_loads(header)
+    source = SourceMeta(
+        source_type="filing_text", filer=cik, accession_number=accession_number,
+        url=meta["url"], description=meta["description"],
+    )
+    return blob, source, meta["fetched_at"]
+
+
+# In-flight fetches keyed like _cache — concurrent misses on the same key
+# await one shared task instead of each hitting SEC (dogpile protection).
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+def _tombstone(exc: BaseException) -> Callable[[], BaseException] | None:
+    """
+    Factory for fresh copies of a definitive miss (unknown ticker, 404).
+
+    Returns None for failures a retry within the minute may fix.  Each
+    caller raises its own instance, so a cached miss neither accumulates
+    traceback entries nor keeps the first failure's frames alive.
+    """
+    if isinstance(exc, TickerNotFoundError):
+        return partial(TickerNotFoundError, *exc.args)
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404:
+        return partial(
+            httpx.HTTPStatusError, str(exc), request=exc.request, response=exc.response,
+        )
+    return None
+
+
+async def _single_flight(key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run *fetch* once per key; concurrent callers share its result.
+
+    Definitive misses are remembered in _negative_cache and re-raised without
+    fetching until the tombstone expires.
+    """
+    miss = _negative_cache.get(key)
+    if miss is not None:
+        raise miss()
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+
+        def _done(t: asyncio.Future) -> None:
+            _inflight.pop(key, None)
+            if not t.cancelled() and t.exception() is not None:
+                tombstone = _tombstone(t.exception())
+                if tombstone is not None:
+                    _negative_cache[key] = tombstone
+
+        task.add_done_callback(_done)
+    # shield: a cancelled waiter must not cancel the fetch other callers share
+    return await asyncio.shield(task)
+
+
+# ---------------------------------------------------------------------------
+# Disk cache — for large, slow-changing payloads worth keeping across restarts
+# ---------------------------------------------------------------------------
+
+_DISK_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "thesis-os"
+
+
+def _disk_cache_path(key: str, suffix: str = ".json") -> Path:
+    return _DISK_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}{suffix}"
+
+
+def _disk_cache_get(key: str, ttl_seconds: float, suffix: str = ".json") -> bytes | None:
+    """Return the cached bytes for *key* if written within *ttl_seconds*."""
+    path = _disk_cache_path(key, suffix)
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _disk_cache_put(key: str, content: bytes, suffix: str = ".json") -> None:
+    """Write *content* atomically; failures only cost a re-download."""
+    path = _disk_cache_path(key, suffix)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Disk cache write failed for %s: %s", key, exc)
+
+
+def prune_disk_cache() -> int:
+    """
+    Delete disk cache files past the longest TTL any reader would accept.
+
+    Readers only ignore expired files, so without this the cache directory
+    grows by one file per filing and per company for the life of the host.
+    Returns the number of files removed.
+    """
+    cutoff = time.time() - max(_FILING_DISK_TTL, _REVALIDATE_TTL, _TICKER_MAP_TTL)
+    removed = 0
+    try:
+        entries = list(os.scandir(_DISK_CACHE_DIR))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _disk_cache_touch(key: str) -> None:
+    """Mark *key* as freshly written, e.g. after a 304 confirmed it is current."""
+    try:
+        os.utime(_disk_cache_path(key))
+    except OSError:
+        pass
 
 
-def _cache_key(*parts: str) -> str:
-    return "|".join(parts)
+def invalidate_ticker(ticker: str) -> int:
+    """Drop every cached entry for *ticker*. Returns the number removed."""
+    # Every ticker-scoped key holds the upper-cased ticker as one of its parts
+    ticker = ticker.upper()
+    removed = 0
+    for cache in _TICKER_CACHES:
+        stale = [k for k in list(cache.keys()) if ticker in k]
+        for k in stale:
+            cache.pop(k, None)
+        removed += len(stale)
+    return removed
 
 
 # ---------------------------------------------------------------------------
 # SEC EDGAR helpers
 # ---------------------------------------------------------------------------
 
-EDGAR_BASE = "https://efts.sec.gov/LATEST"
 EDGAR_SUBMISSIONS = "https://data.sec.gov/submissions"
 EDGAR_FULL_TEXT = "https://efts.sec.gov/LATEST/search-index"
 
-_HEADERS = {"User-Agent": settings.sec_user_agent, "Accept": "application/json"}
+_HEADERS = {"User-Agent": get_settings().sec_user_agent, "Accept": "application/json"}
+
+# One pooled client for SEC so keep-alive connections and TLS sessions
+# survive across calls.  SEC headers and a 30s timeout are client defaults.
+# Created on first use; the app lifespan closes it via close_http_client().
+_client: httpx.AsyncClient | None = None
+
+# Third-party JSON APIs (OpenBB, FMP, Treasury) get a pool of their own: the
+# SEC User-Agent carries the operator's contact details and is never sent to
+# them, and their cookies stay out of the SEC client's jar.
+_api_client: httpx.AsyncClient | None = None
+
+# Yahoo gets its own pool: it needs a browser User-Agent as a client default
+# (never sent to SEC) and its cookies stay out of the SEC client's jar.
+_YAHOO_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+}
+_yahoo_client: httpx.AsyncClient | None = None
+
+# HTTP/2 lets concurrent SEC calls share one connection, but needs the optional
+# h2 package.  Compression needs nothing: httpx already sends
+# Accept-Encoding: gzip, deflate (plus br when brotli is installed).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+@asynccontextmanager
+async def _http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client — leaving the block does not close it."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=_HEADERS,
+            timeout=30,
+            http2=_HTTP2,
+            # Idle SEC connections are kept 30s (httpx default: 5s) so the
+            # gaps between a brief's sequential fetch phases don't force a
+            # fresh TCP + TLS handshake
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=50, keepalive_expiry=30,
+            ),
+        )
+    yield _client
+
+
+@asynccontextmanager
+async def _api_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared third-party API client — leaving the block does not close it."""
+    global _api_client
+    if _api_client is None or _api_client.is_closed:
+        _api_client = httpx.AsyncClient(
+            timeout=30,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    yield _api_client
+
+
+@asynccontextmanager
+async def _yahoo_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared Yahoo Finance client — leaving the block does not close it."""
+    global _yahoo_client
+    if _yahoo_client is None or _yahoo_client.is_closed:
+        _yahoo_client = httpx.AsyncClient(
+            headers=_YAHOO_HEADERS,
+            timeout=15,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    yield _yahoo_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP clients (app shutdown)."""
+    global _client, _api_client, _yahoo_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _api_client is not None:
+        await _api_client.aclose()
+        _api_client = None
+    if _yahoo_client is not None:
+        await _yahoo_client.aclose()
+        _yahoo_client = None
 
 
 def _edgar_filing_url(accession: str, primary_doc: str) -> str:
@@ -78,10 +400,134 @@ def _edgar_filing_url(accession: str, primary_doc: str) -> str:
     return f"https://www.sec.gov/Archives/edgar/data/{acc_no_dashes}/{accession}/{primary_doc}"
 
 
+# SEC allows 10 req/s per user agent; capping in-flight JSON calls at 8 keeps
+# bursts (gathered fetchers, Form 4 fan-out) under it.
+_SEC_SEMAPHORE = asyncio.Semaphore(8)
+
+# Transient upstream failures worth retrying; anything else (404, 403) is final
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.2
+_RETRY_MAX_DELAY = 2.0
+
+
+def _retry_delay(attempt: int, resp: httpx.Response | None) -> float:
+    """Seconds to wait before retry ``attempt`` — Retry-After if sent, else jittered backoff."""
+    if resp is not None:
+        retry_after = resp.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form — fall back to backoff
+    delay = min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY)
+    return delay + random.uniform(0, delay)
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> httpx.Response:
+    """GET with the SEC concurrency cap and retry on transient failures."""
+    attempt = 0
+    while True:
+        resp = None
+        try:
+            async with _SEC_SEMAPHORE:
+                resp = await client.get(url, params=params, headers=headers)
+            if resp.status_code != 304:  # Not Modified answers a conditional GET
+                resp.raise_for_status()
+            break
+        except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+            attempt += 1
+            if attempt >= _RETRY_ATTEMPTS or (
+                resp is not None and resp.status_code not in _RETRY_STATUSES
+            ):
+                raise
+            delay = _retry_delay(attempt - 1, resp)
+            logger.debug("GET %s failed (%s); retry %d in %.2fs", url, exc, attempt, delay)
+            await asyncio.sleep(delay)
+    logger.debug(
+        "GET %s → %s (%s, content-encoding=%s)",
+        url, resp.status_code, resp.http_version, resp.headers.get("content-encoding"),
+    )
+    return resp
+
+
 async def _get(client: httpx.AsyncClient, url: str, params: dict | None = None) -> dict:
-    resp = await client.get(url, params=params, headers=_HEADERS, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return _json_loads((await _send(client, url, params)).content)
+
+
+# Last parsed payload per URL with its ETag / Last-Modified validators.  Kept
+# well past the fresh-cache TTLs so an expired entry is revalidated with a
+# conditional GET — a 304 costs no body and no re-parse.
+_REVALIDATE_TTL = 7 * 86_400
+_revalidate_cache: TTLCache = TTLCache(maxsize=512, ttl=_REVALIDATE_TTL)
+
+
+def _revalidate_disk_key(url: str, schema: str) -> str:
+    return f"revalidate|{schema}|{url}"
+
+
+def _schema_tag(*parts: Any) -> str:
+    """
+    Short digest of what a parser keeps, for persisted revalidation entries.
+
+    The disk entry holds the parsed value, not SEC's body, and a 304 keeps it
+    alive indefinitely — so the tag goes into its key, and a change to the
+    kept fields (or a bumped parser version) starts a fresh entry.
+    """
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:12]
+
+
+async def _get_revalidated(
+    client: httpx.AsyncClient,
+    url: str,
+    parse: Callable[[bytes], Any],
+    schema: str | None = None,
+) -> Any:
+    """
+    GET *url* and ``parse`` the body, reusing the last parse on 304 Not Modified.
+
+    With a ``schema`` tag (see _schema_tag) the validators and parsed value
+    (which must be JSON-serialisable) are also kept in the disk cache, so a
+    restarted process revalidates instead of re-downloading.
+    """
+    cached = _revalidate_cache.get(url)
+    if cached is None and schema is not None:
+        content = await asyncio.to_thread(
+            _disk_cache_get, _revalidate_disk_key(url, schema), _REVALIDATE_TTL,
+        )
+        if content is not None:
+            entry = _json_loads(content)
+            cached = (entry["etag"], entry["last_modified"], entry["value"])
+
+    headers: dict[str, str] = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = await _send(client, url, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        _revalidate_cache[url] = cached
+        if schema is not None:
+            await asyncio.to_thread(_disk_cache_touch, _revalidate_disk_key(url, schema))
+        return cached[2]
+
+    value = parse(resp.content)
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if etag or last_modified:
+        _revalidate_cache[url] = (etag, last_modified, value)
+    if schema is not None:
+        content = _json_dumps({"etag": etag, "last_modified": last_modified, "value": value})
+        await asyncio.to_thread(_disk_cache_put, _revalidate_disk_key(url, schema), content)
+    return value
 
 
 def _filing_base_url(cik: str, accession: str) -> str:
@@ -91,64 +537,165 @@ def _filing_base_url(cik: str, accession: str) -> str:
     return f"https://www.sec.gov/Archives/edgar/data/{cik_num}/{acc_no_dashes}"
 
 
+def _filing_document_url(cik: str, accession: str, document: str) -> str:
+    """
+    URL of a named document in a filing's directory.
+
+    The submissions feed reports XML primary documents behind their XSLT
+    rendering directory (e.g. ``xslF345X05/form4.xml``); the raw file sits
+    at the top level, so the rendering prefix is dropped.
+    """
+    return f"{_filing_base_url(cik, accession)}/{document.rsplit('/', 1)[-1]}"
+
+
 # ---------------------------------------------------------------------------
 # HTML → plain text (for stripping SEC filing HTML)
 # ---------------------------------------------------------------------------
 
-class _HTMLTextExtractor(HTMLParser):
-    """Streaming HTML-to-text converter for SEC filings."""
+# Whitespace clean-up applied to extracted filing text, in this order
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+_RE_HSPACE = re.compile(r"[ \t]+")
+_RE_NL_PADDING = re.compile(r" *\n *")
+
+
+class _FilingTextSink:
+    """
+    Accumulates plain text from tag/data events.
+
+    Implements lxml's parser-target protocol (start / end / data / close), so
+    libxml2 can drive it directly; _HTMLTextExtractor adapts the stdlib
+    tokenizer to the same calls.
+    """
 
     _BLOCK_TAGS = frozenset(("p", "div", "br", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "li"))
     _SKIP_TAGS = frozenset(("script", "style", "head"))
 
+    # Called once per tag and text run of a multi-MB filing, so the handlers
+    # stay lean: slots, a pre-bound write, and no re-lowercasing (both
+    # tokenizers already hand over lower-cased tag names).  Text goes into
+    # one StringIO buffer rather than millions of list entries to join.
+    __slots__ = ("_buf", "_append", "_skip_depth")
+
     def __init__(self) -> None:
-        super().__init__()
-        self._parts: list[str] = []
+        self._buf = io.StringIO()
+        self._append = self._buf.write
         self._skip_depth = 0
 
-    def handle_starttag(self, tag: str, attrs: list) -> None:
-        tag = tag.split(":")[-1].lower()  # handle ix:nonNumeric etc.
+    def start(self, tag: str, attrib: Any = None) -> None:
+        tag = tag.rpartition(":")[2]  # handle ix:nonNumeric etc.
         if tag in self._SKIP_TAGS:
             self._skip_depth += 1
         elif tag in self._BLOCK_TAGS:
-            self._parts.append("\n")
+            self._append("\n")
         elif tag == "td":
-            self._parts.append("\t")
+            self._append("\t")
 
-    def handle_endtag(self, tag: str) -> None:
-        tag = tag.split(":")[-1].lower()
+    def end(self, tag: str) -> None:
+        tag = tag.rpartition(":")[2]
         if tag in self._SKIP_TAGS:
             self._skip_depth = max(0, self._skip_depth - 1)
-        elif tag in self._BLOCK_TAGS:
-            self._parts.append("\n")
+        elif tag in self._BLOCK_TAGS and tag != "br":  # <br> is void — one break, not two
+            self._append("\n")
 
-    def handle_data(self, data: str) -> None:
+    def data(self, data: str) -> None:
         if self._skip_depth == 0:
-            self._parts.append(data)
+            self._append(data)
 
-    def get_text(self) -> str:
-        text = "".join(self._parts)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r" *\n *", "\n", text)
+    def close(self) -> str:
+        text = self._buf.getvalue()
+        text = _RE_MULTI_NL.sub("\n\n", text)
+        text = _RE_HSPACE.sub(" ", text)
+        text = _RE_NL_PADDING.sub("\n", text)
         return text.strip()
 
 
+class _HTMLTextExtractor(HTMLParser):
+    """Stdlib tokenizer feeding a _FilingTextSink — the fallback without lxml."""
+
+    def __init__(self, sink: _FilingTextSink) -> None:
+        super().__init__()
+        self._sink = sink
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        self._sink.start(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._sink.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self._sink.data(data)
+
+
+class _FilingTextParser:
+    """
+    Incremental SEC filing HTML → plain text.
+
+    feed() raw bytes as they arrive and close() for the text, so a filing is
+    parsed while it downloads and never held whole as a str.  Tokenizes with
+    libxml2 when lxml is installed, else the stdlib HTMLParser.
+    """
+
+    def __init__(self, encoding: str = "utf-8") -> None:
+        self._sink = _FilingTextSink()
+        if _lxml_etree is not None:
+            # huge_tree lifts libxml2's text-node limits for multi-MB filings
+            self._lxml = _lxml_etree.HTMLParser(
+                target=self._sink, encoding=encoding, huge_tree=True,
+            )
+        else:
+            self._lxml = None
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            self._html = _HTMLTextExtractor(self._sink)
+
+    def feed(self, chunk: bytes) -> None:
+        if self._lxml is not None:
+            self._lxml.feed(chunk)
+        else:
+            self._html.feed(self._decoder.decode(chunk))
+
+    def close(self) -> str:
+        if self._lxml is not None:
+            try:
+                return self._lxml.close()
+            except _lxml_etree.XMLSyntaxError:  # nothing parseable was fed
+                return self._sink.close()
+        self._html.feed(self._decoder.decode(b"", final=True))
+        self._html.close()
+        return self._sink.close()
+
+
 def _strip_html(html: str) -> str:
     """Convert SEC filing HTML to clean plain text."""
-    parser = _HTMLTextExtractor()
-    parser.feed(html)
-    return parser.get_text()
+    parser = _FilingTextParser()
+    parser.feed(html.encode("utf-8"))
+    return parser.close()
 
 
-def _xml_text(el: ET.Element | None, path: str) -> str:
+def _xml_text(el: Any, path: str) -> str:
     """Safely extract text from an XML element by path."""
     if el is None:
         return ""
+    if _lxml_etree is not None:
+        return _xpath_string(path)(el).strip()
     node = el.find(path)
     return (node.text or "").strip() if node is not None else ""
 
 
+@lru_cache(maxsize=None)
+def _xpath_string(path: str) -> Any:
+    """Compiled lxml XPath returning the string value of the first match for *path*."""
+    return _lxml_etree.XPath(f"string(({path})[1])")
+
+
+if _lxml_etree is not None:
+    # Form 4s are remote input — never expand entities or touch the network
+    _FORM4_XML_PARSER = _lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+    _XML_PARSE_ERRORS: tuple[type[Exception], ...] = (ET.ParseError, _lxml_etree.XMLSyntaxError)
+else:
+    _FORM4_XML_PARSER = None
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+
 # ---------------------------------------------------------------------------
 # SEC EDGAR: Company filings (10-K, 10-Q, 8-K)
 # ---------------------------------------------------------------------------
@@ -158,14 +705,57 @@ def _xml_text(el: ET.Element | None, path: str) -> str:
 # ---------------------------------------------------------------------------
 
 # SIC → sector template key.  Only sectors with built templates are mapped.
-SIC_TO_SECTOR: dict[int, str] = {
+SIC_TO_SECTOR: Mapping[int, str] = MappingProxyType({
     # Software
     7371: "saas", 7372: "saas", 7373: "saas", 7374: "saas", 7379: "saas",
     # Semiconductors & related
     3674: "semis", 3672: "semis", 3679: "semis", 3677: "semis",
     # Semiconductor equipment
     3559: "semis", 3825: "semis",
-}
+})
+
+
+_SUBMISSION_FIELDS = ("name", "sic", "sicDescription", "fiscalYearEnd")
+_RECENT_FILING_FIELDS = ("form", "filingDate", "accessionNumber", "primaryDocument")
+# Bump the leading version when _parse_submissions' logic changes
+_SUBMISSIONS_SCHEMA = _schema_tag(1, _SUBMISSION_FIELDS, _RECENT_FILING_FIELDS)
+
+
+def _parse_submissions(content: bytes) -> dict:
+    """
+    Decode a submissions document, keeping only the fields the readers use.
+
+    The document is decoded whole rather than stream-parsed up to a limit:
+    ``filings.recent`` is columnar (one array per field), so the first N
+    filings are only complete once every column has been read, and the one
+    pruned parse is shared by all submission readers and revalidated.
+    """
+    raw = _json_loads(content)
+    pruned = {k: raw[k] for k in _SUBMISSION_FIELDS if k in raw}
+    recent = raw.get("filings", {}).get("recent", {})
+    pruned["filings"] = {
+        "recent": {k: recent[k] for k in _RECENT_FILING_FIELDS if k in recent},
+    }
+    return pruned
+
+
+async def _fetch_submissions(cik: str) -> dict:
+    """
+    GET the EDGAR submissions document for *cik*, pruned by _parse_submissions.
+
+    Metadata, the filing index, insider filings and segment lookup all read
+    this one document; concurrent callers share a single request, and an
+    unchanged document is revalidated — across restarts too — rather than
+    re-downloaded.
+    """
+    async def fetch() -> dict:
+        async with _http_client() as client:
+            return await _get_revalidated(
+                client, f"{EDGAR_SUBMISSIONS}/CIK{cik}.json", _parse_submissions,
+                schema=_SUBMISSIONS_SCHEMA,
+            )
+
+    return await _single_flight(("submissions-raw", cik), fetch)
 
 
 async def get_company_submissions(ticker: str) -> DataResult:
@@ -175,15 +765,15 @@ async def get_company_submissions(ticker: str) -> DataResult:
     Returns entity name, CIK, SIC code, SIC description, fiscal year end,
     and a mapped sector key (if a template exists for this SIC).
     """
-    key = _cache_key("submissions", ticker.upper())
+    key = ("submissions", ticker.upper())
     if key in _cache:
         return _cache[key]
+    return await _single_flight(key, lambda: _fetch_company_submissions(ticker, key))
 
-    cik = await _resolve_cik(ticker)
 
-    async with httpx.AsyncClient() as client:
-        url = f"{EDGAR_SUBMISSIONS}/CIK{cik}.json"
-        submissions = await _get(client, url)
+async def _fetch_company_submissions(ticker: str, key: tuple) -> DataResult:
+    cik = await _resolve_cik(ticker)
+    submissions = await _fetch_submissions(cik)
 
     sic = int(submissions.get("sic", 0) or 0)
     data = {
@@ -223,49 +813,42 @@ async def get_company_filings(
     Returns a list of filing dicts, each with accession_number, form_type,
     filing_date, primary_doc, and a direct URL.
     """
-    key = _cache_key("filings", ticker, str(form_types), str(limit))
+    key = ("filings", ticker.upper(), tuple(form_types) if form_types is not None else None, limit)
     if key in _cache:
         return _cache[key]
+    return await _single_flight(
+        key, lambda: _fetch_company_filings(ticker, form_types, limit, key),
+    )
 
-    async with httpx.AsyncClient() as client:
-        # Resolve ticker → CIK via EDGAR company tickers JSON
-        tickers_url = "https://www.sec.gov/files/company_tickers.json"
-        tickers_data = await _get(client, tickers_url)
-        cik = None
-        for entry in tickers_data.values():
-            if entry["ticker"].upper() == ticker.upper():
-                cik = str(entry["cik_str"]).zfill(10)
-                break
-        if cik is None:
-            raise ValueError(f"Ticker {ticker} not found in SEC EDGAR")
 
-        # Fetch submissions
-        sub_url = f"{EDGAR_SUBMISSIONS}/CIK{cik}.json"
-        submissions = await _get(client, sub_url)
-        recent = submissions.get("filings", {}).get("recent", {})
+async def _fetch_company_filings(
+    ticker: str, form_types: list[str] | None, limit: int, key: tuple,
+) -> DataResult:
+    cik = await _resolve_cik(ticker)
+    submissions = await _fetch_submissions(cik)
+    recent = submissions.get("filings", {}).get("recent", {})
 
-        filings: list[dict] = []
-        forms = recent.get("form", [])
-        dates = recent.get("filingDate", [])
-        accessions = recent.get("accessionNumber", [])
-        primary_docs = recent.get("primaryDocument", [])
+    filings: list[FilingRow] = []
+    form_set = frozenset(form_types) if form_types else None
 
-        for i, form in enumerate(forms):
-            if form_types and form not in form_types:
-                continue
-            accession = accessions[i]
-            primary_doc = primary_docs[i]
-            filing = {
-                "form_type": form,
-                "filing_date": dates[i],
-                "accession_number": accession,
-                "primary_document": primary_doc,
-                "url": _edgar_filing_url(accession, primary_doc),
-                "cik": cik,
-            }
-            filings.append(filing)
-            if len(filings) >= limit:
-                break
+    for form, filing_date, accession, primary_doc in zip(
+        recent.get("form", []),
+        recent.get("filingDate", []),
+        recent.get("accessionNumber", []),
+        recent.get("primaryDocument", []),
+    ):
+        if form_set is not None and form not in form_set:
+            continue
+        filings.append(FilingRow(
+            form_type=form,
+            filing_date=filing_date,
+            accession_number=accession,
+            primary_document=primary_doc,
+            url=_edgar_filing_url(accession, primary_doc),
+            cik=cik,
+        ))
+        if len(filings) >= limit:
+            break
 
     result = DataResult(
         data=filings,
@@ -284,6 +867,38 @@ async def get_company_filings(
 # SEC EDGAR: Full-text search within filings
 # ---------------------------------------------------------------------------
 
+async def _efts_search(
+    q: str,
+    forms: str | None = None,
+    entity: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> dict:
+    """
+    Query the EDGAR full-text search index.
+
+    Shared by search_filings and get_13f_holdings; identical concurrent
+    queries share one request.
+    """
+    params: dict[str, Any] = {
+        "q": q,
+        "dateRange": "custom",
+        "startdt": date_from or "",
+        "enddt": date_to or "",
+    }
+    if entity:
+        params["entityName"] = entity
+    if forms:
+        params["forms"] = forms
+
+    async def fetch() -> dict:
+        async with _http_client() as client:
+            return await _get(client, EDGAR_FULL_TEXT, params)
+
+    key = ("efts", *params.items())
+    return await _single_flight(key, fetch)
+
+
 async def search_filings(
     query: str,
     ticker: str | None = None,
@@ -298,30 +913,21 @@ async def search_filings(
     Useful for finding specific language — e.g. "customer concentration",
     "revenue recognition", "goodwill impairment".
     """
-    key = _cache_key("search", query, str(ticker), str(form_types))
+    key = (
+        "search", query, ticker.upper() if ticker else None,
+        tuple(form_types) if form_types else None,
+        date_from, date_to, limit,
+    )
     if key in _cache:
         return _cache[key]
 
-    params: dict[str, Any] = {"q": query, "dateRange": "custom", "startdt": "", "enddt": ""}
-    if ticker:
-        params["entityName"] = ticker
-    if form_types:
-        params["forms"] = ",".join(form_types)
-    if date_from:
-        params["startdt"] = date_from
-    if date_to:
-        params["enddt"] = date_to
-
-    async with httpx.AsyncClient() as client:
-        url = f"{EDGAR_BASE}/search-index"
-        resp = await client.get(
-            "https://efts.sec.gov/LATEST/search-index",
-            params=params,
-            headers=_HEADERS,
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    data = await _efts_search(
+        query,
+        forms=",".join(form_types) if form_types else None,
+        entity=ticker,
+        date_from=date_from,
+        date_to=date_to,
+    )
 
     hits = data.get("hits", {}).get("hits", [])[:limit]
     results = []
@@ -340,7 +946,7 @@ async def search_filings(
         source=SourceMeta(
             source_type="full_text_search",
             filer=ticker or "all",
-            url=f"https://efts.sec.gov/LATEST/search-index?q={query}",
+            url=f"{EDGAR_FULL_TEXT}?q={query}",
             description=f"EDGAR full-text search: '{query}'",
         ),
     )
@@ -352,6 +958,9 @@ async def search_filings(
 # SEC EDGAR: Insider transactions (Forms 3, 4, 5)
 # ---------------------------------------------------------------------------
 
+_INSIDER_FORMS = frozenset({"3", "4", "5"})
+
+
 async def get_insider_transactions(ticker: str, limit: int = 50) -> DataResult:
     """
     Fetch recent insider transactions from SEC EDGAR.
@@ -359,24 +968,12 @@ async def get_insider_transactions(ticker: str, limit: int = 50) -> DataResult:
     Each transaction includes: insider name, title, transaction type,
     shares, price, value, date, and whether it's a 10b5-1 plan transaction.
     """
-    key = _cache_key("insider", ticker, str(limit))
+    key = ("insider", ticker.upper(), limit)
     if key in _cache:
         return _cache[key]
 
-    # Resolve CIK
-    async with httpx.AsyncClient() as client:
-        tickers_data = await _get(client, "https://www.sec.gov/files/company_tickers.json")
-        cik = None
-        for entry in tickers_data.values():
-            if entry["ticker"].upper() == ticker.upper():
-                cik = str(entry["cik_str"]).zfill(10)
-                break
-        if cik is None:
-            raise ValueError(f"Ticker {ticker} not found in SEC EDGAR")
-
-        # Fetch owner submissions (Forms 4)
-        sub_url = f"{EDGAR_SUBMISSIONS}/CIK{cik}.json"
-        submissions = await _get(client, sub_url)
+    cik = await _resolve_cik(ticker)
+    submissions = await _fetch_submissions(cik)
 
     recent = submissions.get("filings", {}).get("recent", {})
     forms = recent.get("form", [])
@@ -386,7 +983,7 @@ async def get_insider_transactions(ticker: str, limit: int = 50) -> DataResult:
 
     transactions: list[dict] = []
     for i, form in enumerate(forms):
-        if form not in ("3", "4", "5"):
+        if form not in _INSIDER_FORMS:
             continue
         transactions.append({
             "form_type": form,
@@ -418,13 +1015,26 @@ async def get_insider_transactions(ticker: str, limit: int = 50) -> DataResult:
 # SEC EDGAR: Parsed insider transaction details (Form 4 XML)
 # ---------------------------------------------------------------------------
 
+def _to_float(s: str) -> float | None:
+    """Parse a Form 4 numeric field; blank or malformed values become None."""
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
 def _parse_form4_xml(
-    xml_text: str, accession: str, filing_date: str, cik: str,
+    xml_text: bytes, accession: str, filing_date: str, cik: str,
 ) -> list[dict]:
     """Parse a Form 4 XML document into structured transaction dicts."""
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
+        if _FORM4_XML_PARSER is not None:
+            root = _lxml_etree.fromstring(xml_text, _FORM4_XML_PARSER)
+        else:
+            root = ET.fromstring(xml_text)
+    except _XML_PARSE_ERRORS:
         return []
 
     # Owner info
@@ -452,9 +1062,9 @@ def _parse_form4_xml(
         txn_date = _xml_text(txn, ".//transactionDate/value")
         acq_disp = _xml_text(txn, ".//transactionAcquiredDisposedCode/value")
 
-        shares = float(shares_s) if shares_s else None
-        price = float(price_s) if price_s else None
-        post_shares = float(post_s) if post_s else None
+        shares = _to_float(shares_s)
+        price = _to_float(price_s)
+        post_shares = _to_float(post_s)
         value = round(shares * price, 2) if shares and price else None
 
         transactions.append({
@@ -486,10 +1096,13 @@ async def get_insider_details(ticker: str, limit: int = 15) -> DataResult:
     Returns full transaction details: owner name/title, buy/sell, shares, price,
     value, shares remaining, and 10b5-1 flag.
     """
-    key = _cache_key("insider_details", ticker.upper(), str(limit))
+    key = ("insider_details", ticker.upper(), limit)
     if key in _cache:
         return _cache[key]
+    return await _single_flight(key, lambda: _fetch_insider_details(ticker, limit, key))
 
+
+async def _fetch_insider_details(ticker: str, limit: int, key: tuple) -> DataResult:
     cik = await _resolve_cik(ticker)
 
     # Get the list of Form 4 filing metadata
@@ -498,38 +1111,53 @@ async def get_insider_details(ticker: str, limit: int = 15) -> DataResult:
         f for f in filings_result.data if f.get("form_type") == "4"
     ][:limit]
 
-    all_transactions: list[dict] = []
+    async def _find_xml_url(client: httpx.AsyncClient, accession: str) -> str | None:
+        # Fetch filing index to find the XML file
+        base = _filing_base_url(cik, accession)
+        idx = await _get(client, f"{base}/index.json")
+        items = idx.get("directory", {}).get("item", [])
+        xml_files = [
+            i for i in items
+            if i["name"].endswith(".xml")
+            and not i["name"].startswith("R")
+            and i["name"] != "primary_doc.xml"
+            and "FilingSummary" not in i["name"]
+        ]
+        return f"{base}/{xml_files[0]['name']}" if xml_files else None
 
-    async with httpx.AsyncClient() as client:
-        for filing in form4_filings:
-            accession = filing["accession_number"]
-            base = _filing_base_url(cik, accession)
+    async def _fetch_one(client: httpx.AsyncClient, filing: dict) -> list[dict]:
+        accession = filing["accession_number"]
+        primary_doc = filing.get("primary_document") or ""
 
-            try:
-                # Fetch filing index to find the XML file
-                idx = await _get(client, f"{base}/index.json")
-                items = idx.get("directory", {}).get("item", [])
-                xml_files = [
-                    i for i in items
-                    if i["name"].endswith(".xml")
-                    and not i["name"].startswith("R")
-                    and i["name"] != "primary_doc.xml"
-                    and "FilingSummary" not in i["name"]
-                ]
-                if not xml_files:
-                    continue
+        try:
+            # The submissions feed already names the ownership XML — fetch
+            # it directly and only list the filing directory if that 404s
+            resp = None
+            if primary_doc.endswith(".xml"):
+                try:
+                    resp = await _send(client, _filing_document_url(cik, accession, primary_doc))
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code != 404:
+                        raise
+            if resp is None:
+                xml_url = await _find_xml_url(client, accession)
+                if xml_url is None:
+                    return []
+                resp = await _send(client, xml_url)
+
+            return _parse_form4_xml(
+                resp.content, accession, filing["filing_date"], cik,
+            )
+        except Exception as exc:
+            logger.warning("Failed to parse Form 4 %s: %s", accession, exc)
+            return []
 
-                xml_url = f"{base}/{xml_files[0]['name']}"
-                resp = await client.get(xml_url, headers=_HEADERS, timeout=15)
-                resp.raise_for_status()
+    # Filings are independent — fetch them concurrently; _send's SEC
+    # semaphore keeps the fan-out within EDGAR's rate limit
+    async with _http_client() as client:
+        per_filing = await asyncio.gather(*(_fetch_one(client, f) for f in form4_filings))
 
-                parsed = _parse_form4_xml(
-                    resp.text, accession, filing["filing_date"], cik,
-                )
-                all_transactions.extend(parsed)
-            except Exception as exc:
-                logger.warning("Failed to parse Form 4 %s: %s", accession, exc)
-                continue
+    all_transactions = [txn for txns in per_filing for txn in txns]
 
     result = DataResult(
         data=all_transactions,
@@ -559,26 +1187,11 @@ async def get_13f_holdings(ticker: str, limit: int = 20) -> DataResult:
     Uses the EDGAR full-text search to find 13F-HR filings that mention
     the ticker, then returns holder names, share counts, and values.
     """
-    key = _cache_key("13f", ticker, str(limit))
+    key = ("13f", ticker.upper(), limit)
     if key in _cache:
         return _cache[key]
 
-    async with httpx.AsyncClient() as client:
-        params = {
-            "q": ticker,
-            "forms": "13F-HR",
-            "dateRange": "custom",
-            "startdt": "",
-            "enddt": "",
-        }
-        resp = await client.get(
-            "https://efts.sec.gov/LATEST/search-index",
-            params=params,
-            headers=_HEADERS,
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    data = await _efts_search(ticker, forms="13F-HR")
 
     hits = data.get("hits", {}).get("hits", [])[:limit]
     holders: list[dict] = []
@@ -601,7 +1214,7 @@ async def get_13f_holdings(ticker: str, limit: int = 20) -> DataResult:
             source_type="13F",
             filer=ticker.upper(),
             section="13F-HR Information Table",
-            url=f"https://efts.sec.gov/LATEST/search-index?q={ticker}&forms=13F-HR",
+            url=f"{EDGAR_FULL_TEXT}?q={ticker}&forms=13F-HR",
             description=f"13F institutional holders mentioning {ticker.upper()} (45-day lag from quarter-end)",
         ),
     )
@@ -620,49 +1233,53 @@ async def get_fundamentals(ticker: str) -> DataResult:
     Returns income statement, balance sheet, and cash flow data
     for the most recent fiscal year.
     """
-    key = _cache_key("fundamentals", ticker)
-    if key in _cache:
-        return _cache[key]
+    key = ("fundamentals", ticker.upper())
+    if key in _fundamentals_cache:
+        return _fundamentals_cache[key]
+    return await _single_flight(key, lambda: _fetch_fundamentals(ticker, key))
+
 
+async def _fetch_fundamentals(ticker: str, key: tuple) -> DataResult:
     # OpenBB Platform v4 exposes a REST API when run locally.
     # Fall back to direct provider (FMP free tier) if no local instance.
     base = "http://localhost:8000/api/v1"
     headers = {}
-    if settings.openbb_token:
-        headers["Authorization"] = f"Bearer {settings.openbb_token}"
+    openbb_token = get_settings().openbb_token
+    if openbb_token:
+        headers["Authorization"] = f"Bearer {openbb_token}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            income_resp = await client.get(
-                f"{base}/equity/fundamental/income",
-                params={"symbol": ticker, "limit": 4, "provider": "fmp"},
-                headers=headers,
-                timeout=30,
-            )
-            income_resp.raise_for_status()
-            income = income_resp.json()
-
-            balance_resp = await client.get(
-                f"{base}/equity/fundamental/balance",
-                params={"symbol": ticker, "limit": 4, "provider": "fmp"},
-                headers=headers,
-                timeout=30,
-            )
-            balance_resp.raise_for_status()
-            balance = balance_resp.json()
+    params = {"symbol": ticker, "limit": 4, "provider": "fmp"}
 
-            cashflow_resp = await client.get(
-                f"{base}/equity/fundamental/cash",
-                params={"symbol": ticker, "limit": 4, "provider": "fmp"},
-                headers=headers,
-                timeout=30,
-            )
-            cashflow_resp.raise_for_status()
-            cashflow = cashflow_resp.json()
+    async def _statement(client: httpx.AsyncClient, statement: str) -> dict:
+        resp = await client.get(
+            f"{base}/equity/fundamental/{statement}", params=params, headers=headers,
+        )
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+    # The three statements are independent — fetch them concurrently
+    async with _api_http_client() as client:
+        results = await asyncio.gather(
+            _statement(client, "income"),
+            _statement(client, "balance"),
+            _statement(client, "cash"),
+            return_exceptions=True,
+        )
 
-        except httpx.HTTPError as exc:
-            logger.warning("OpenBB Platform unavailable (%s), returning empty fundamentals", exc)
-            income = balance = cashflow = {"results": []}
+    # A statement that fails over HTTP comes back empty without discarding
+    # the ones that did arrive; anything else is a bug and propagates
+    for res in results:
+        if isinstance(res, BaseException) and not isinstance(res, httpx.HTTPError):
+            raise res
+    income, balance, cashflow = (
+        {"results": []} if isinstance(res, httpx.HTTPError) else res for res in results
+    )
+    failures = [res for res in results if isinstance(res, httpx.HTTPError)]
+    if failures:
+        logger.warning(
+            "OpenBB Platform unavailable for %d of 3 statements (%s), returning them empty",
+            len(failures), failures[0],
+        )
 
     data = {
         "income_statement": income.get("results", []),
@@ -681,7 +1298,7 @@ async def get_fundamentals(ticker: str) -> DataResult:
             ),
         ),
     )
-    _cache[key] = result
+    _fundamentals_cache[key] = result
     return result
 
 
@@ -697,14 +1314,20 @@ async def get_prices(
     """
     Fetch daily OHLCV price history via OpenBB Platform.
     """
-    key = _cache_key("prices", ticker, str(start), str(end))
+    key = ("prices", ticker.upper(), start, end)
     if key in _cache:
         return _cache[key]
+    return await _single_flight(key, lambda: _fetch_prices(ticker, start, end, key))
 
+
+async def _fetch_prices(
+    ticker: str, start: str | None, end: str | None, key: tuple,
+) -> DataResult:
     base = "http://localhost:8000/api/v1"
     headers = {}
-    if settings.openbb_token:
-        headers["Authorization"] = f"Bearer {settings.openbb_token}"
+    openbb_token = get_settings().openbb_token
+    if openbb_token:
+        headers["Authorization"] = f"Bearer {openbb_token}"
 
     params: dict[str, Any] = {"symbol": ticker, "provider": "fmp"}
     if start:
@@ -712,16 +1335,15 @@ async def get_prices(
     if end:
         params["end_date"] = end
 
-    async with httpx.AsyncClient() as client:
+    async with _api_http_client() as client:
         try:
             resp = await client.get(
                 f"{base}/equity/price/historical",
                 params=params,
                 headers=headers,
-                timeout=30,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
         except httpx.HTTPError as exc:
             logger.warning("OpenBB Platform unavailable (%s), returning empty prices", exc)
             data = {"results": []}
@@ -750,13 +1372,22 @@ async def get_filing_text(accession_number: str, cik: str) -> DataResult:
     downloads the HTML, strips tags, and returns clean plain text
     suitable for LLM analysis.
     """
-    key = _cache_key("filing_text", accession_number)
-    if key in _cache:
-        return _cache[key]
+    key = ("filing_text", accession_number)
+    packed = _filing_cache.get(key)
+    if packed is not None:
+        return _unpack_filing_text(packed)
+    return await _single_flight(key, lambda: _fetch_filing_text(accession_number, cik, key))
+
+
+async def _fetch_filing_text(accession_number: str, cik: str, key: tuple) -> DataResult:
+    packed = await asyncio.to_thread(_filing_text_from_disk, accession_number, cik)
+    if packed is not None:
+        _filing_cache[key] = packed
+        return _unpack_filing_text(packed)
 
     base = _filing_base_url(cik, accession_number)
 
-    async with httpx.AsyncClient() as client:
+    async with _http_client() as client:
         # Fetch the filing index JSON to find the primary document
         index_url = f"{base}/index.json"
         idx = await _get(client, index_url)
@@ -768,11 +1399,6 @@ async def get_filing_text(accession_number: str, cik: str) -> DataResult:
             if i.get("name", "").lower().endswith((".htm", ".html"))
             and not i["name"].startswith("R")
         ]
-        htm_files.sort(
-            key=lambda x: int(str(x.get("size", "0")).replace(",", "") or "0"),
-            reverse=True,
-        )
-
         if not htm_files:
             return DataResult(
                 data="",
@@ -783,15 +1409,20 @@ async def get_filing_text(accession_number: str, cik: str) -> DataResult:
                 ),
             )
 
-        primary_doc = htm_files[0]["name"]
+        primary_doc = max(
+            htm_files, key=lambda x: int(str(x.get("size", "0")).replace(",", "") or "0"),
+        )["name"]
         doc_url = f"{base}/{primary_doc}"
 
-        # Fetch the actual filing document (can be large — 60s timeout)
-        resp = await client.get(doc_url, headers=_HEADERS, timeout=60)
-        resp.raise_for_status()
-        html = resp.text
+        # Stream the filing document (can be large — 60s timeout) straight
+        # into the parser rather than buffering the whole HTML first
+        async with client.stream("GET", doc_url, timeout=60) as resp:
+            resp.raise_for_status()
+            parser = _FilingTextParser(resp.encoding or "utf-8")
+            async for chunk in resp.aiter_bytes(65_536):
+                parser.feed(chunk)
 
-    text = _strip_html(html)
+    text = parser.close()
 
     result = DataResult(
         data=text,
@@ -803,7 +1434,9 @@ async def get_filing_text(accession_number: str, cik: str) -> DataResult:
             description=f"Full text of {primary_doc} ({accession_number})",
         ),
     )
-    _cache[key] = result
+    packed = _pack_filing_text(result)
+    _filing_cache[key] = packed
+    await asyncio.to_thread(_filing_text_to_disk, accession_number, packed)
     return result
 
 
@@ -811,174 +1444,258 @@ async def get_filing_text(accession_number: str, cik: str) -> DataResult:
 # CIK resolution helper (cached)
 # ---------------------------------------------------------------------------
 
+# company_tickers.json is multi-MB and changes rarely — indexed once a day
+_TICKER_MAP_TTL = 86_400
+_ticker_map_cache: TTLCache = TTLCache(maxsize=1, ttl=_TICKER_MAP_TTL)
+_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+# Bump when _build_ticker_map's output changes
+_TICKER_MAP_SCHEMA = _schema_tag("ticker_map", 1)
+
+
+async def _load_ticker_map() -> dict[str, str]:
+    """Map of upper-cased ticker → zero-padded 10-digit CIK for all EDGAR filers."""
+    ticker_map = _ticker_map_cache.get("map")
+    if ticker_map is None:
+        ticker_map = await _single_flight(("ticker_map",), _fetch_ticker_map)
+    return ticker_map
+
+
+def _build_ticker_map(content: bytes) -> dict[str, str]:
+    data = _json_loads(content)
+    # Reversed so the first listing of a ticker wins, as the old linear scan did
+    return {
+        entry["ticker"].upper(): str(entry["cik_str"]).zfill(10)
+        for entry in reversed(data.values())
+    }
+
+
+async def _fetch_ticker_map() -> dict[str, str]:
+    # The built map — not SEC's payload — survives restarts on disk: within a
+    # day a fresh process loads it as-is, after that it is revalidated with
+    # the stored validators and only re-downloaded if SEC has changed it
+    content = await asyncio.to_thread(
+        _disk_cache_get,
+        _revalidate_disk_key(_COMPANY_TICKERS_URL, _TICKER_MAP_SCHEMA),
+        _TICKER_MAP_TTL,
+    )
+    if content is not None:
+        ticker_map = _json_loads(content)["value"]
+    else:
+        async with _http_client() as client:
+            ticker_map = await _get_revalidated(
+                client, _COMPANY_TICKERS_URL, _build_ticker_map, schema=_TICKER_MAP_SCHEMA,
+            )
+    _ticker_map_cache["map"] = ticker_map
+    return ticker_map
+
+
 async def _resolve_cik(ticker: str) -> str:
     """Resolve a ticker symbol to a zero-padded 10-digit SEC CIK."""
-    key = _cache_key("cik", ticker.upper())
-    if key in _cache:
-        return _cache[key]
-    async with httpx.AsyncClient() as client:
-        data = await _get(client, "https://www.sec.gov/files/company_tickers.json")
-    for entry in data.values():
-        if entry["ticker"].upper() == ticker.upper():
-            cik = str(entry["cik_str"]).zfill(10)
-            _cache[key] = cik
-            return cik
-    raise ValueError(f"Ticker {ticker} not found in SEC EDGAR")
+    cik = (await _load_ticker_map()).get(ticker.upper())
+    if cik is None:
+        raise TickerNotFoundError(f"Ticker {ticker} not found in SEC EDGAR")
+    return cik
 
 
 # ---------------------------------------------------------------------------
 # XBRL concept name → internal field name mapping
 #
-# Each entry: field_name -> (list_of_candidate_xbrl_concepts, unit_key)
+# Each entry: field_name -> (tuple_of_candidate_xbrl_concepts, unit_key)
 # We try candidates in order and use the first one found for a given company.
 # ---------------------------------------------------------------------------
 
-XBRL_FIELD_MAP: dict[str, tuple[list[str], str]] = {
+XBRL_FIELD_MAP: Mapping[str, tuple[tuple[str, ...], str]] = MappingProxyType({
     # --- Income Statement ---
-    "revenue": ([
+    "revenue": ((
         "RevenueFromContractWithCustomerExcludingAssessedTax",
         "Revenues",
         "SalesRevenueNet",
         "RevenueFromContractWithCustomerIncludingAssessedTax",
-    ], "USD"),
-    "cost_of_revenue": ([
+    ), "USD"),
+    "cost_of_revenue": ((
         "CostOfGoodsAndServicesSold",
         "CostOfRevenue",
         "CostOfGoodsSold",
-    ], "USD"),
-    "gross_profit": ([
+    ), "USD"),
+    "gross_profit": ((
         "GrossProfit",
-    ], "USD"),
-    "research_and_development": ([
+    ), "USD"),
+    "research_and_development": ((
         "ResearchAndDevelopmentExpense",
-    ], "USD"),
-    "sga": ([
+    ), "USD"),
+    "sga": ((
         "SellingGeneralAndAdministrativeExpense",
-    ], "USD"),
-    "operating_income": ([
+    ), "USD"),
+    "operating_income": ((
         "OperatingIncomeLoss",
-    ], "USD"),
-    "net_income": ([
+    ), "USD"),
+    "net_income": ((
         "NetIncomeLoss",
-    ], "USD"),
-    "interest_expense": ([
+    ), "USD"),
+    "interest_expense": ((
         "InterestExpense",
         "InterestExpenseDebt",
-    ], "USD"),
-    "income_tax": ([
+    ), "USD"),
+    "income_tax": ((
         "IncomeTaxExpenseBenefit",
-    ], "USD"),
-    "depreciation_amortization": ([
+    ), "USD"),
+    "depreciation_amortization": ((
         "DepreciationDepletionAndAmortization",
         "DepreciationAndAmortization",
         "Depreciation",
-    ], "USD"),
-    "sbc": ([
+    ), "USD"),
+    "sbc": ((
         "ShareBasedCompensation",
         "AllocatedShareBasedCompensationExpense",
-    ], "USD"),
+    ), "USD"),
 
     # --- Balance Sheet ---
-    "total_assets": ([
+    "total_assets": ((
         "Assets",
-    ], "USD"),
-    "current_assets": ([
+    ), "USD"),
+    "current_assets": ((
         "AssetsCurrent",
-    ], "USD"),
-    "cash_and_equivalents": ([
+    ), "USD"),
+    "cash_and_equivalents": ((
         "CashAndCashEquivalentsAtCarryingValue",
         "CashCashEquivalentsAndShortTermInvestments",
-    ], "USD"),
-    "short_term_investments": ([
+    ), "USD"),
+    "short_term_investments": ((
         "ShortTermInvestments",
         "AvailableForSaleSecuritiesCurrent",
         "MarketableSecuritiesCurrent",
-    ], "USD"),
-    "accounts_receivable": ([
+    ), "USD"),
+    "accounts_receivable": ((
         "AccountsReceivableNetCurrent",
         "AccountsReceivableNet",
-    ], "USD"),
-    "inventory": ([
+    ), "USD"),
+    "inventory": ((
         "InventoryNet",
-    ], "USD"),
-    "property_plant_equipment": ([
+    ), "USD"),
+    "property_plant_equipment": ((
         "PropertyPlantAndEquipmentNet",
-    ], "USD"),
-    "total_liabilities": ([
+    ), "USD"),
+    "total_liabilities": ((
         "Liabilities",
-    ], "USD"),
-    "current_liabilities": ([
+    ), "USD"),
+    "current_liabilities": ((
         "LiabilitiesCurrent",
-    ], "USD"),
-    "long_term_debt": ([
+    ), "USD"),
+    "long_term_debt": ((
         "LongTermDebtNoncurrent",
         "LongTermDebt",
-    ], "USD"),
-    "short_term_debt": ([
+    ), "USD"),
+    "short_term_debt": ((
         "ShortTermBorrowings",
         "DebtCurrent",
         "LongTermDebtCurrent",
-    ], "USD"),
-    "total_equity": ([
+    ), "USD"),
+    "total_equity": ((
         "StockholdersEquity",
         "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest",
-    ], "USD"),
-    "retained_earnings": ([
+    ), "USD"),
+    "retained_earnings": ((
         "RetainedEarningsAccumulatedDeficit",
-    ], "USD"),
-    "goodwill": ([
+    ), "USD"),
+    "goodwill": ((
         "Goodwill",
-    ], "USD"),
-    "intangible_assets": ([
+    ), "USD"),
+    "intangible_assets": ((
         "IntangibleAssetsNetExcludingGoodwill",
         "FiniteLivedIntangibleAssetsNet",
-    ], "USD"),
+    ), "USD"),
 
     # --- Revenue visibility (leading indicators) ---
-    "rpo": ([
+    "rpo": ((
         "RevenueRemainingPerformanceObligation",
-    ], "USD"),
-    "rpo_current": ([
+    ), "USD"),
+    "rpo_current": ((
         "RevenueRemainingPerformanceObligationExpectedToBeRecognizedInNextTwelveMonths",
         "RevenueRemainingPerformanceObligationCurrent",
-    ], "USD"),
-    "deferred_revenue": ([
+    ), "USD"),
+    "deferred_revenue": ((
         "ContractWithCustomerLiability",
         "DeferredRevenue",
         "ContractWithCustomerLiabilityCurrent",
         "DeferredRevenueCurrent",
-    ], "USD"),
-    "deferred_revenue_noncurrent": ([
+    ), "USD"),
+    "deferred_revenue_noncurrent": ((
         "ContractWithCustomerLiabilityNoncurrent",
         "DeferredRevenueNoncurrent",
-    ], "USD"),
+    ), "USD"),
 
     # --- Operating expense breakdown ---
-    "sales_and_marketing": ([
+    "sales_and_marketing": ((
         "SellingAndMarketingExpense",
-    ], "USD"),
+    ), "USD"),
 
     # --- Cash Flow ---
-    "operating_cash_flow": ([
+    "operating_cash_flow": ((
         "NetCashProvidedByUsedInOperatingActivities",
-    ], "USD"),
-    "capex": ([
+    ), "USD"),
+    "capex": ((
         "PaymentsToAcquirePropertyPlantAndEquipment",
-    ], "USD"),
-    "dividends_paid": ([
+    ), "USD"),
+    "dividends_paid": ((
         "PaymentsOfDividends",
         "PaymentsOfDividendsCommonStock",
-    ], "USD"),
-    "share_repurchases": ([
+    ), "USD"),
+    "share_repurchases": ((
         "PaymentsForRepurchaseOfCommonStock",
-    ], "USD"),
+    ), "USD"),
 
     # --- Shares (often in the dei namespace) ---
-    "shares_outstanding": ([
+    "shares_outstanding": ((
         "EntityCommonStockSharesOutstanding",
         "CommonStockSharesOutstanding",
-    ], "shares"),
-}
+    ), "shares"),
+})
+
+# Every concept XBRL_FIELD_MAP can ask for — used to prune companyfacts
+_WANTED_CONCEPTS: frozenset[str] = frozenset(
+    c for concepts, _ in XBRL_FIELD_MAP.values() for c in concepts
+)
+# _parse_company_facts keeps exactly these concepts; bump the leading version
+# when its logic changes
+_COMPANY_FACTS_SCHEMA = _schema_tag(1, sorted(_WANTED_CONCEPTS))
+
+# Reverse index: concept → (field_name, unit_key, priority) for every field
+# that accepts it.  Lower priority is the field's preferred concept.
+_concept_to_fields: dict[str, tuple[tuple[str, str, int], ...]] = {}
+for _field_name, (_concepts, _unit_key) in XBRL_FIELD_MAP.items():
+    for _priority, _concept in enumerate(_concepts):
+        _concept_to_fields[_concept] = _concept_to_fields.get(_concept, ()) + (
+            (_field_name, _unit_key, _priority),
+        )
+_CONCEPT_TO_FIELDS: Mapping[str, tuple[tuple[str, str, int], ...]] = MappingProxyType(
+    _concept_to_fields
+)
+del _concept_to_fields, _field_name, _concepts, _unit_key, _priority, _concept
+
+_ANNUAL_FORMS = frozenset({"10-K", "10-K/A", "20-F", "20-F/A"})
+_QUARTERLY_FORMS = frozenset({"10-Q", "10-Q/A"})
+_QUARTERLY_PERIODS = frozenset({"Q1", "Q2", "Q3"})
+
+
+def _fy_key(e: dict) -> Any:
+    return e.get("fy", 0)
+
+
+def _fyq_key(e: dict) -> tuple:
+    return (e.get("fy", 0), e.get("fp", ""))
+
+
+def _format_fact(e: dict, concept: str) -> dict:
+    return {
+        "value": e["val"],
+        "period_end": e.get("end"),
+        "fiscal_year": e.get("fy"),
+        "fiscal_period": e.get("fp"),
+        "form": e.get("form"),
+        "accession": e.get("accn"),
+        "filed": e.get("filed"),
+        "xbrl_concept": concept,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -999,90 +1716,119 @@ async def get_company_facts(
     most recent quarterly entries (from 10-Q filings).  Quarterly entries use
     a composite key "FY{year}-{period}" for dedup (e.g. "2025-Q3").
     """
-    key = _cache_key("companyfacts", ticker.upper(), str(periods), str(include_quarterly))
-    if key in _cache:
-        return _cache[key]
+    key = ("companyfacts", ticker.upper(), periods, include_quarterly)
+    if key in _fundamentals_cache:
+        return _fundamentals_cache[key]
+    return await _single_flight(
+        key, lambda: _fetch_company_facts(ticker, periods, include_quarterly, key),
+    )
 
+
+def _parse_company_facts(content: bytes) -> tuple[str | None, dict[str, dict]]:
+    """
+    Decode companyfacts into (entity name, mapped concepts only).
+
+    Keeps the few dozen concepts XBRL_FIELD_MAP can use out of thousands so
+    the full document is dropped before the per-field pass.  orjson decodes
+    the whole body in one C call; a streaming parser cannot skip ahead here
+    because wanted concepts are scattered through the us-gaap object.
+    """
+    raw = _json_loads(content)
+    raw_facts = raw.get("facts", {})
+    dei = raw_facts.get("dei", {})
+    us_gaap = raw_facts.get("us-gaap", {})
+    # Probe the few dozen wanted concepts rather than scanning the hundreds a
+    # filer reports; us-gaap wins over dei when a concept appears in both
+    present = {}
+    for concept in _WANTED_CONCEPTS:
+        value = us_gaap.get(concept)
+        if not value:
+            value = dei.get(concept)
+            if value is None:
+                continue
+        present[concept] = value
+    return raw.get("entityName"), present
+
+
+async def _fetch_company_facts(
+    ticker: str, periods: int, include_quarterly: bool, key: tuple,
+) -> DataResult:
     cik = await _resolve_cik(ticker)
 
-    async with httpx.AsyncClient() as client:
+    async with _http_client() as client:
         url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
-        raw = await _get(client, url)
-
-    entity_name = raw.get("entityName", ticker.upper())
-    us_gaap = raw.get("facts", {}).get("us-gaap", {})
-    dei = raw.get("facts", {}).get("dei", {})
+        # Persisted pruned, so a restart revalidates a few hundred KB of
+        # mapped concepts instead of re-downloading and re-decoding the
+        # full multi-MB document
+        entity_name, present = await _get_revalidated(
+            client, url, _parse_company_facts, schema=_COMPANY_FACTS_SCHEMA,
+        )
+    if entity_name is None:
+        entity_name = ticker.upper()
+
+    # One pass over the concepts this company actually reports, bucketing
+    # them under the fields that accept them
+    candidates: dict[str, list[tuple[int, str, str, dict]]] = {}
+    for concept, concept_data in present.items():
+        if not concept_data:
+            continue
+        for field_name, unit_key, priority in _CONCEPT_TO_FIELDS[concept]:
+            candidates.setdefault(field_name, []).append(
+                (priority, concept, unit_key, concept_data)
+            )
 
     facts: dict[str, list[dict]] = {}
     quarterly: dict[str, list[dict]] = {}
 
-    for field_name, (xbrl_concepts, unit_key) in XBRL_FIELD_MAP.items():
-        for concept in xbrl_concepts:
-            # Check both namespaces
-            concept_data = us_gaap.get(concept) or dei.get(concept)
-            if not concept_data:
-                continue
-
+    for field_name in XBRL_FIELD_MAP:
+        options = candidates.get(field_name)
+        if not options:
+            continue
+        options.sort(key=itemgetter(0))
+        for _, concept, unit_key, concept_data in options:
             entries = concept_data.get("units", {}).get(unit_key, [])
 
+            # One pass over the entries buckets annual values by fiscal year
+            # and quarterly (10-Q) values by (fiscal year, period), keeping
+            # the most recently filed value per bucket as (filed, entry)
+            by_fy: dict[Any, tuple[str, dict]] = {}
+            by_fyq: dict[tuple, tuple[str, dict]] = {}
+            for e in entries:
+                fp = e.get("fp")
+                form = e.get("form")
+                if fp == "FY":
+                    if form not in _ANNUAL_FORMS:
+                        continue
+                    bucket, bucket_key = by_fy, e.get("fy", 0)
+                elif (
+                    include_quarterly
+                    and fp in _QUARTERLY_PERIODS
+                    and form in _QUARTERLY_FORMS
+                ):
+                    bucket, bucket_key = by_fyq, (e.get("fy", 0), fp)
+                else:
+                    continue
+                filed = e.get("filed", "")
+                existing = bucket.get(bucket_key)
+                if existing is None or filed > existing[0]:
+                    bucket[bucket_key] = (filed, e)
+
             # --- Annual entries ---
-            annual = [
-                e for e in entries
-                if e.get("fp") == "FY"
-                and e.get("form") in ("10-K", "10-K/A", "20-F", "20-F/A")
-            ]
-
-            # Deduplicate by fiscal year — keep the most recently filed value
-            by_fy: dict[int, dict] = {}
-            for e in annual:
-                fy = e.get("fy", 0)
-                existing = by_fy.get(fy)
-                if existing is None or e.get("filed", "") > existing.get("filed", ""):
-                    by_fy[fy] = e
-
-            sorted_entries = sorted(
-                by_fy.values(), key=lambda e: e.get("fy", 0), reverse=True
-            )[:periods]
-
-            def _format_entry(e: dict) -> dict:
-                return {
-                    "value": e["val"],
-                    "period_end": e.get("end"),
-                    "fiscal_year": e.get("fy"),
-                    "fiscal_period": e.get("fp"),
-                    "form": e.get("form"),
-                    "accession": e.get("accn"),
-                    "filed": e.get("filed"),
-                    "xbrl_concept": concept,
-                }
+            sorted_entries = heapq.nlargest(
+                periods, (e for _, e in by_fy.values()), key=_fy_key,
+            )
 
             if sorted_entries:
-                facts[field_name] = [_format_entry(e) for e in sorted_entries]
+                facts[field_name] = [_format_fact(e, concept) for e in sorted_entries]
 
             # --- Quarterly entries (10-Q only) ---
             if include_quarterly:
-                qtr = [
-                    e for e in entries
-                    if e.get("fp") in ("Q1", "Q2", "Q3")
-                    and e.get("form") in ("10-Q", "10-Q/A")
-                ]
-
-                # Dedup by (fiscal_year, fiscal_period) — keep most recent filing
-                by_fyq: dict[str, dict] = {}
-                for e in qtr:
-                    qkey = f"{e.get('fy', 0)}-{e.get('fp', '')}"
-                    existing = by_fyq.get(qkey)
-                    if existing is None or e.get("filed", "") > existing.get("filed", ""):
-                        by_fyq[qkey] = e
-
-                sorted_qtr = sorted(
-                    by_fyq.values(),
-                    key=lambda e: (e.get("fy", 0), e.get("fp", "")),
-                    reverse=True,
-                )[: periods * 4]
+                sorted_qtr = heapq.nlargest(
+                    periods * 4, (e for _, e in by_fyq.values()), key=_fyq_key,
+                )
 
                 if sorted_qtr:
-                    quarterly[field_name] = [_format_entry(e) for e in sorted_qtr]
+                    quarterly[field_name] = [_format_fact(e, concept) for e in sorted_qtr]
 
             if sorted_entries or (include_quarterly and quarterly.get(field_name)):
                 break  # Found data for this field, stop trying alternatives
@@ -1104,10 +1850,32 @@ async def get_company_facts(
             description=f"SEC XBRL companyfacts for {entity_name}",
         ),
     )
-    _cache[key] = result
+    _fundamentals_cache[key] = result
     return result
 
 
+async def warm_cache(tickers: list[str], concurrency: int = 5) -> None:
+    """
+    Prefetch submissions and companyfacts for *tickers* so first hits are warm.
+
+    Failures are logged and skipped — warming is best-effort.  At most
+    *concurrency* tickers are in flight at once to stay polite to SEC.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def warm(ticker: str) -> None:
+        async with sem:
+            # Same arguments as the brief path, so the cache keys line up
+            await get_company_submissions(ticker)
+            await get_company_facts(ticker, include_quarterly=True)
+
+    results = await asyncio.gather(*(warm(t) for t in tickers), return_exceptions=True)
+    failed = [t for t, r in zip(tickers, results) if isinstance(r, Exception)]
+    if failed:
+        logger.warning("Cache warm failed for %s", ", ".join(failed))
+    logger.info("Warmed cache for %d/%d tickers", len(tickers) - len(failed), len(tickers))
+
+
 # ---------------------------------------------------------------------------
 # Segment revenue decomposition from XBRL instance document
 # ---------------------------------------------------------------------------
@@ -1121,10 +1889,13 @@ async def get_segment_revenue(ticker: str) -> DataResult:
     Returns segments for the two most recent fiscal years (for YoY comparison).
     Returns data=None if no segment data is found.
     """
-    key = _cache_key("segments", ticker.upper())
-    if key in _cache:
-        return _cache[key]
+    key = ("segments", ticker.upper())
+    if key in _fundamentals_cache:
+        return _fundamentals_cache[key]
+    return await _single_flight(key, lambda: _fetch_segment_revenue(ticker, key))
 
+
+async def _fetch_segment_revenue(ticker: str, key: tuple) -> DataResult:
     empty_result = DataResult(
         data=None,
         source=SourceMeta(source_type="xbrl_segments", filer=ticker.upper()),
@@ -1135,9 +1906,7 @@ async def get_segment_revenue(ticker: str) -> DataResult:
         cik_int = str(int(cik))
 
         # Get latest 10-K accession
-        sub_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-        async with httpx.AsyncClient() as client:
-            sub_raw = await _get(client, sub_url)
+        sub_raw = await _fetch_submissions(cik)
 
         filings = sub_raw.get("filings", {}).get("recent", {})
         forms = filings.get("form", [])
@@ -1147,13 +1916,13 @@ async def get_segment_revenue(ticker: str) -> DataResult:
         acc = None
         primary_doc = None
         for i, form in enumerate(forms):
-            if form in ("10-K", "10-K/A", "20-F", "20-F/A"):
+            if form in _ANNUAL_FORMS:
                 acc = accessions[i]
                 primary_doc = primary_docs[i]
                 break
 
         if acc is None:
-            _cache[key] = empty_result
+            _fundamentals_cache[key] = empty_result
             return empty_result
 
         # Fetch the XBRL instance XML (_htm.xml)
@@ -1164,23 +1933,21 @@ async def get_segment_revenue(ticker: str) -> DataResult:
             f"{acc_no_dash}/{base_name}_htm.xml"
         )
 
-        async with httpx.AsyncClient() as client:
+        async with _http_client() as client:
             resp = await client.get(
                 xml_url,
-                headers={"User-Agent": settings.sec_user_agent},
                 follow_redirects=True,
-                timeout=30,
             )
             if resp.status_code != 200:
                 logger.info("No XBRL instance at %s (status %s)", xml_url, resp.status_code)
-                _cache[key] = empty_result
+                _fundamentals_cache[key] = empty_result
                 return empty_result
             xml_text = resp.text
 
         segments = _parse_segment_revenue(xml_text)
 
         if not segments:
-            _cache[key] = empty_result
+            _fundamentals_cache[key] = empty_result
             return empty_result
 
         result = DataResult(
@@ -1192,12 +1959,12 @@ async def get_segment_revenue(ticker: str) -> DataResult:
                 description=f"Segment revenue from XBRL instance ({acc})",
             ),
         )
-        _cache[key] = result
+        _fundamentals_cache[key] = result
         return result
 
     except Exception as exc:
         logger.warning("Segment revenue parsing failed for %s: %s", ticker, exc)
-        _cache[key] = empty_result
+        _fundamentals_cache[key] = empty_result
         return empty_result
 
 
@@ -1297,7 +2064,7 @@ def _parse_segment_revenue(xml_text: str) -> list[dict] | None:
         by_period[f["end"]].append(f)
 
     # Take the two most recent periods
-    sorted_periods = sorted(by_period.keys(), reverse=True)[:2]
+    sorted_periods = heapq.nlargest(2, by_period)
     if not sorted_periods:
         return None
 
@@ -1346,10 +2113,13 @@ async def get_consensus_estimates(ticker: str) -> DataResult:
     Returns consensus revenue and EPS for the next fiscal year.
     Requires FMP_API_KEY in .env.
     """
-    key = _cache_key("consensus", ticker.upper())
-    if key in _cache:
-        return _cache[key]
+    key = ("consensus", ticker.upper())
+    if key in _fundamentals_cache:
+        return _fundamentals_cache[key]
+    return await _single_flight(key, lambda: _fetch_consensus_estimates(ticker, key))
+
 
+async def _fetch_consensus_estimates(ticker: str, key: tuple) -> DataResult:
     data: dict[str, Any] = {
         "consensus_revenue": None,
         "consensus_revenue_prior": None,
@@ -1361,7 +2131,8 @@ async def get_consensus_estimates(ticker: str) -> DataResult:
     }
     source_desc = f"Consensus estimates unavailable for {ticker.upper()}"
 
-    if not settings.fmp_api_key:
+    fmp_api_key = get_settings().fmp_api_key
+    if not fmp_api_key:
         logger.info("No FMP_API_KEY — skipping consensus estimates")
         result = DataResult(
             data=data,
@@ -1371,19 +2142,19 @@ async def get_consensus_estimates(ticker: str) -> DataResult:
                 description="FMP_API_KEY not configured",
             ),
         )
-        _cache[key] = result
+        _fundamentals_cache[key] = result
         return result
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with _api_http_client() as client:
             url = f"https://financialmodelingprep.com/api/v3/analyst-estimates/{ticker.upper()}"
             resp = await client.get(
                 url,
-                params={"apikey": settings.fmp_api_key},
+                params={"apikey": fmp_api_key},
                 timeout=15,
             )
             resp.raise_for_status()
-            estimates = resp.json()
+            estimates = _json_loads(resp.content)
 
         if estimates and len(estimates) >= 2:
             # estimates[0] = next fiscal year, estimates[1] = current/prior fiscal year
@@ -1431,58 +2202,77 @@ async def get_consensus_estimates(ticker: str) -> DataResult:
             description=source_desc,
         ),
     )
-    _cache[key] = result
+    _fundamentals_cache[key] = result
     return result
 
 
+_YAHOO_QUOTE_HOSTS = ("query1.finance.yahoo.com", "query2.finance.yahoo.com")
+
+
+async def _fetch_yahoo_quote(
+    client: httpx.AsyncClient, host: str, ticker: str,
+) -> tuple[float, str, str] | None:
+    """(price, currency, host) from one Yahoo chart host, or None if it had nothing."""
+    url = f"https://{host}/v8/finance/chart/{ticker}"
+    try:
+        resp = await client.get(url, params={"interval": "1d", "range": "5d"})
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+        meta = data["chart"]["result"][0]["meta"]
+        price = meta.get("regularMarketPrice") or meta.get("previousClose")
+        if price is not None:
+            return price, meta.get("currency", "USD"), host
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 429:
+            logger.info("Yahoo %s rate-limited for %s", host, ticker)
+        else:
+            logger.warning("Yahoo %s error for %s: %s", host, ticker, exc)
+    except Exception as exc:
+        logger.warning("Yahoo %s failed for %s: %s", host, ticker, exc)
+    return None
+
+
 async def get_quote(ticker: str) -> DataResult:
     """
     Fetch current price with fallback chain:
-      1. Yahoo Finance v8 chart (query1)
-      2. Yahoo Finance v8 chart (query2 — separate rate-limit pool)
-      3. SEC XBRL shares_outstanding × last known price is handled upstream
+      1. Yahoo Finance v8 chart, query1 and query2 (separate rate-limit
+         pools) raced concurrently — the first usable answer wins
+      2. SEC XBRL shares_outstanding × last known price is handled upstream
          in quant.py if this function returns price=None.
 
     Returns price, currency.
     """
-    key = _cache_key("quote", ticker.upper())
-    if key in _cache:
-        return _cache[key]
+    key = ("quote", ticker.upper())
+    if key in _quote_cache:
+        return _quote_cache[key]
+    return await _single_flight(key, lambda: _fetch_quote(ticker, key))
 
-    params = {"interval": "1d", "range": "5d"}
-    yf_headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/131.0.0.0 Safari/537.36"
-        ),
-    }
 
+async def _fetch_quote(ticker: str, key: tuple) -> DataResult:
     price = None
     currency = "USD"
     source_desc = f"Quote unavailable for {ticker.upper()}"
 
-    # Try both Yahoo query hosts (separate rate-limit pools)
-    async with httpx.AsyncClient() as client:
-        for host in ("query1.finance.yahoo.com", "query2.finance.yahoo.com"):
-            url = f"https://{host}/v8/finance/chart/{ticker}"
-            try:
-                resp = await client.get(url, params=params, headers=yf_headers, timeout=15)
-                resp.raise_for_status()
-                data = resp.json()
-                meta = data["chart"]["result"][0]["meta"]
-                price = meta.get("regularMarketPrice") or meta.get("previousClose")
-                currency = meta.get("currency", "USD")
-                if price is not None:
-                    source_desc = f"Real-time quote for {ticker.upper()} via Yahoo Finance ({host})"
-                    break
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == 429:
-                    logger.info("Yahoo %s rate-limited for %s, trying next host", host, ticker)
-                    continue
-                logger.warning("Yahoo %s error for %s: %s", host, ticker, exc)
-            except Exception as exc:
-                logger.warning("Yahoo %s failed for %s: %s", host, ticker, exc)
+    # Ask both Yahoo query hosts (separate rate-limit pools) at once and take
+    # the first usable answer, so a 429 on one doesn't cost a second round trip
+    async with _yahoo_http_client() as client:
+        pending = {
+            asyncio.create_task(_fetch_yahoo_quote(client, host, ticker))
+            for host in _YAHOO_QUOTE_HOSTS
+        }
+        try:
+            while pending and price is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    quote = task.result()
+                    if quote is not None and price is None:
+                        price, currency, host = quote
+                        source_desc = (
+                            f"Real-time quote for {ticker.upper()} via Yahoo Finance ({host})"
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
 
     if price is None:
         logger.warning("All quote sources failed for %s — price will be None", ticker)
@@ -1495,7 +2285,7 @@ async def get_quote(ticker: str) -> DataResult:
             description=source_desc,
         ),
     )
-    _cache[key] = result
+    _quote_cache[key] = result
     return result
 
 
@@ -1509,10 +2299,13 @@ async def get_treasury_yield() -> DataResult:
 
     Returns the yield as a decimal (e.g. 0.0425 for 4.25%).
     """
-    key = _cache_key("treasury_10y")
-    if key in _cache:
-        return _cache[key]
+    key = ("treasury_10y",)
+    if key in _fundamentals_cache:
+        return _fundamentals_cache[key]
+    return await _single_flight(key, lambda: _fetch_treasury_yield(key))
 
+
+async def _fetch_treasury_yield(key: tuple) -> DataResult:
     ten_year = 0.0425
     yield_date = "fallback"
 
@@ -1524,10 +2317,10 @@ async def get_treasury_yield() -> DataResult:
         "&filter=security_desc:eq:Treasury Bonds"
     )
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            resp = await client.get(url, timeout=15)
+        async with _api_http_client() as client:
+            resp = await client.get(url, timeout=15, follow_redirects=True)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             records = data.get("data", [])
             if records:
                 raw_val = records[0].get("avg_interest_rate_amt")
@@ -1546,5 +2339,5 @@ async def get_treasury_yield() -> DataResult:
             description=f"US Treasury 10Y yield: {ten_year:.2%}",
         ),
     )
-    _cache[key] = result
+    _fundamentals_cache[key] = result
     return result
@@ -19,15 +19,30 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    false,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from app.config import settings
-
-engine = create_async_engine(settings.database_url, echo=False)
+from app.config import get_settings
+
+_settings = get_settings()
+engine = create_async_engine(
+    _settings.database_url,
+    echo=False,
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_max_overflow,
+    # Drop connections Postgres or a proxy closed while idle, before use
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # asyncpg's statement cache plus SQLAlchemy's prepared-statement cache
+    # (both default to 100) keep the ORM's repeated relationship and lookup
+    # queries from being re-parsed and re-planned
+    connect_args={"statement_cache_size": 1024, "prepared_statement_cache_size": 1024},
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -50,7 +65,7 @@ class Thesis(Base):
     thesis_text: Mapped[str] = mapped_column(Text, nullable=False)
     sector_template: Mapped[str] = mapped_column(String(30), nullable=False)
     status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="draft"
+        String(20), nullable=False, default="draft", server_default="draft"
     )  # draft, monitoring, killed, closed
 
     variant: Mapped[str | None] = mapped_column(Text)
@@ -79,6 +94,12 @@ class Thesis(Base):
         back_populates="thesis", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Backs list_theses' ORDER BY created_at DESC, id DESC and its
+        # (created_at, id) keyset cursor
+        Index("idx_theses_created_at", created_at.desc(), id.desc()),
+    )
+
 
 # ---------------------------------------------------------------------------
 # Claims — falsifiable statements within a thesis
@@ -92,12 +113,14 @@ class Claim(Base):
     )
     statement: Mapped[str] = mapped_column(Text, nullable=False)
     kpi_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    kpi_family: Mapped[str] = mapped_column(String(20), default="lagging")
+    kpi_family: Mapped[str] = mapped_column(
+        String(20), default="lagging", server_default="lagging"
+    )
     current_value: Mapped[float | None] = mapped_column(Numeric(16, 4))
     qoq_delta: Mapped[float | None] = mapped_column(Numeric(10, 4))
     yoy_delta: Mapped[float | None] = mapped_column(Numeric(10, 4))
     status: Mapped[str] = mapped_column(
-        String(20), default="supported"
+        String(20), default="supported", server_default="supported"
     )  # supported, partial, unverified, no_data, contradicted
     last_updated: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
@@ -125,7 +148,9 @@ class KillCriterion(Base):
 
     current_value: Mapped[float | None] = mapped_column(Numeric(16, 4))
     current_source: Mapped[dict | None] = mapped_column(JSONB)  # Citation as JSON
-    status: Mapped[str] = mapped_column(String(10), default="ok")  # ok, watch, breach
+    status: Mapped[str] = mapped_column(
+        String(10), default="ok", server_default="ok"
+    )  # ok, watch, breach
     distance_pct: Mapped[float | None] = mapped_column(Numeric(10, 4))
     watch_reason: Mapped[str | None] = mapped_column(Text)
     last_updated: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -180,7 +205,9 @@ class ChangeEvent(Base):
     source: Mapped[dict] = mapped_column(JSONB, nullable=False)  # Citation as JSON
 
     interpretation: Mapped[str | None] = mapped_column(Text)
-    interpretation_is_fact: Mapped[bool] = mapped_column(Boolean, default=False)
+    interpretation_is_fact: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false()
+    )
 
     claims_impacted: Mapped[list | None] = mapped_column(JSONB)
     claim_impact: Mapped[str | None] = mapped_column(String(15))
@@ -192,6 +219,12 @@ class ChangeEvent(Base):
     __table_args__ = (
         Index("idx_change_events_ticker", "ticker", timestamp.desc()),
         Index("idx_change_events_severity", "severity", timestamp.desc()),
+        # Latest alerts for a ticker; most events are "info", so the partial
+        # index stays small
+        Index(
+            "idx_change_events_alerts", "ticker", timestamp.desc(),
+            postgresql_where=text("severity IN ('watch', 'breach')"),
+        ),
     )
 
 
@@ -210,7 +243,7 @@ class Catalyst(Base):
     event: Mapped[str] = mapped_column(Text, nullable=False)
     claims_tested: Mapped[list | None] = mapped_column(JSONB)
     kill_criteria_tested: Mapped[list | None] = mapped_column(JSONB)
-    occurred: Mapped[bool] = mapped_column(Boolean, default=False)
+    occurred: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
     outcome_notes: Mapped[str | None] = mapped_column(Text)
 
     thesis: Mapped[Thesis] = relationship(back_populates="catalysts")
@@ -0,0 +1,39 @@
+"""
+Shared engine instances.
+
+Engines are stateless between calls, so one instance of each is shared across
+requests and modules (the qualitative engine keeps its Anthropic client's
+connection pool warm).  Built lazily so importing this module stays cheap.
+"""
+
+from __future__ import annotations
+
+from app.flow import FlowEngine
+from app.qualitative import QualitativeEngine
+from app.quant import QuantEngine
+
+_QUANT: QuantEngine | None = None
+_FLOW: FlowEngine | None = None
+_QUAL: QualitativeEngine | None = None
+
+
+def get_quant_engine() -> QuantEngine:
+    global _QUANT
+    if _QUANT is None:
+        _QUANT = QuantEngine()
+    return _QUANT
+
+
+def get_flow_engine() -> FlowEngine:
+    global _FLOW
+    if _FLOW is None:
+        _FLOW = FlowEngine()
+    return _FLOW
+
+
+def get_qualitative_engine() -> QualitativeEngine:
+    """Raises ValueError (and caches nothing) when no API key is configured."""
+    global _QUAL
+    if _QUAL is None:
+        _QUAL = QualitativeEngine()
+    return _QUAL
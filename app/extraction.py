@@ -14,7 +14,7 @@ from __future__ import annotations
 import logging
 from datetime import date
 
-from app.config import settings
+from app.config import get_settings
 from app.data import SourceMeta, get_company_filings
 from app.qualitative import QualitativeEngine
 from app.quant import KPIResult, QuantOutput
@@ -39,7 +39,7 @@ async def supplement_kpis_from_filings(
     If none need extraction, returns immediately (no LLM cost).
     Otherwise, fetches the latest 10-K and extracts the missing values.
     """
-    if not settings.anthropic_api_key:
+    if not get_settings().anthropic_api_key:
         logger.info("No API key — skipping filing supplement")
         return quant_output
 
@@ -82,9 +82,9 @@ async def supplement_kpis_from_filings(
         extracted = await engine.extract_structured_kpis(
             ticker=ticker,
             kpi_requests=kpi_requests,
-            form_type=filing["form_type"],
-            accession_number=filing["accession_number"],
-            cik=filing["cik"],
+            form_type=filing.form_type,
+            accession_number=filing.accession_number,
+            cik=filing.cik,
         )
     except Exception as exc:
         logger.warning("Filing extraction failed for %s: %s", ticker, exc)
@@ -114,15 +114,15 @@ async def supplement_kpis_from_filings(
                 unit=kpi_def.unit,
                 period=item.get("period", "?"),
                 source=SourceMeta(
-                    source_type=filing["form_type"],
+                    source_type=filing.form_type,
                     filer=ticker.upper(),
                     filing_date=(
-                        date.fromisoformat(filing["filing_date"])
-                        if filing.get("filing_date") else None
+                        date.fromisoformat(filing.filing_date)
+                        if filing.filing_date else None
                     ),
-                    accession_number=filing["accession_number"],
-                    url=filing.get("url", ""),
-                    description=f"Extracted from {filing['form_type']}: {item.get('exact_quote', '')[:100]}",
+                    accession_number=filing.accession_number,
+                    url=filing.url,
+                    description=f"Extracted from {filing.form_type}: {item.get('exact_quote', '')[:100]}",
                 ),
                 computation=f"LLM extraction: \"{item.get('exact_quote', '')}\"",
                 note="; ".join(note_parts),
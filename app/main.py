@@ -4,6 +4,7 @@ FastAPI application — Thesis OS API.
 Routes:
   GET    /health                     — liveness check
   GET    /brief/{ticker}             — generate a full Decision Brief
+  POST   /refresh/{ticker}           — drop cached upstream data for a ticker
   POST   /command                    — dispatch a command (/thesis, /stress, /filing, /evidence)
   POST   /chat                       — alias for /command
   POST   /thesis/{ticker}            — compile + persist a thesis
@@ -16,6 +17,7 @@ Routes:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from contextlib import asynccontextmanager
@@ -30,12 +32,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app import crud
 from app.brief import DecisionBriefResponse, detect_sector, generate_brief
 from app.coverage import DriverCoverageResponse, compute_coverage_from_claims
-from app.data import get_company_submissions
+from app.config import get_settings
+from app.data import (
+    close_http_client,
+    get_company_submissions,
+    invalidate_ticker,
+    prune_disk_cache,
+    warm_cache,
+)
 from app.changes import ChangeFeedResponse, detect_changes
 from app.db import get_session, init_db
+from app.engines import get_quant_engine
 from app.export import export_brief_markdown, export_brief_pdf, export_thesis_markdown
 from app.extraction import supplement_kpis_from_filings
-from app.quant import QuantEngine
+from app.qualitative import close_anthropic_client
 from app.templates import SECTOR_TEMPLATES, get_template
 from app.thesis import CommandRouter, ThesisCompiler
 
@@ -53,7 +63,17 @@ logging.basicConfig(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    removed = await asyncio.to_thread(prune_disk_cache)
+    if removed:
+        logging.getLogger(__name__).info("Pruned %d expired disk cache files", removed)
+    # Warm in the background — startup shouldn't wait on SEC
+    watchlist = [t.strip().upper() for t in get_settings().watchlist.split(",") if t.strip()]
+    warmer = asyncio.create_task(warm_cache(watchlist)) if watchlist else None
     yield
+    if warmer is not None:
+        warmer.cancel()
+    await close_http_client()
+    await close_anthropic_client()
 
 
 app = FastAPI(
@@ -71,6 +91,17 @@ app.add_middleware(
 )
 
 
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes via pydantic-core.
+
+    Uses the model class's pre-built serializer and skips FastAPI's
+    re-validation + jsonable_encoder pass for large payloads whose models
+    were already built from trusted engine output (brief, change feed).
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 # ───────────────────────────────────────────────────────────────────────────
 # Pydantic response models — thesis CRUD
 # ───────────────────────────────────────────────────────────────────────────
@@ -197,7 +228,7 @@ async def get_brief(
             f"Options: {', '.join(sorted(SECTOR_TEMPLATES.keys()))}"
         ),
     ),
-) -> DecisionBriefResponse:
+) -> Response:
     """
     Generate a full Decision Brief for the given ticker.
 
@@ -214,7 +245,7 @@ async def get_brief(
         )
 
     try:
-        return await generate_brief(ticker, sector_override=sector)
+        brief = await generate_brief(ticker, sector_override=sector)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
@@ -223,6 +254,20 @@ async def get_brief(
             status_code=502,
             detail=f"Failed to generate brief for {ticker.upper()}: {exc}",
         )
+    return _json_response(brief)
+
+
+@app.post(
+    "/refresh/{ticker}",
+    summary="Drop cached upstream data for a ticker",
+)
+async def refresh_ticker(ticker: str) -> dict:
+    """
+    Invalidate cached SEC/market data for a ticker so the next brief or
+    feed request refetches from source.
+    """
+    removed = invalidate_ticker(ticker)
+    return {"ticker": ticker.upper(), "entries_invalidated": removed}
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -311,7 +356,8 @@ async def compile_thesis(
     """
     ticker = ticker.upper()
 
-    # 1. Detect sector
+    # 1. Detect sector (submissions are fetched once and reused for the CIK)
+    sub_meta = (await get_company_submissions(ticker)).data
     if req.sector:
         if req.sector not in SECTOR_TEMPLATES:
             raise HTTPException(
@@ -320,10 +366,10 @@ async def compile_thesis(
             )
         template = get_template(req.sector)
     else:
-        _, template, _ = await detect_sector(ticker)
+        _, template, _ = await detect_sector(ticker, sub_meta)
 
     # 2. Run quant engine for KPI values + market-implied context
-    quant_engine = QuantEngine()
+    quant_engine = get_quant_engine()
     try:
         quant_output = await quant_engine.analyze(ticker, template)
     except Exception as exc:
@@ -331,8 +377,7 @@ async def compile_thesis(
         raise HTTPException(status_code=502, detail=f"Quant engine failed: {exc}")
 
     # 2b. Supplement KPIs from filing text
-    sub_result = await get_company_submissions(ticker)
-    cik = sub_result.data["cik"] if not req.sector else sub_result.data.get("cik", "")
+    cik = sub_meta["cik"] if not req.sector else sub_meta.get("cik", "")
     try:
         quant_output = await supplement_kpis_from_filings(
             ticker, template, quant_output, cik,
@@ -399,11 +444,27 @@ async def list_theses(
     status: str | None = Query(default=None, description="Filter by status (draft, monitoring, closed, killed)"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    before: datetime | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor: created_at of the last thesis on the previous page "
+            "(overrides offset; requires before_id)"
+        ),
+    ),
+    before_id: uuid.UUID | None = Query(
+        default=None,
+        description="Keyset cursor: id of the last thesis on the previous page",
+    ),
     session: AsyncSession = Depends(get_session),
 ) -> ThesisListResponse:
     """List theses, optionally filtered by ticker and/or status."""
+    if (before is None) != (before_id is None):
+        raise HTTPException(
+            status_code=400, detail="before and before_id must be given together",
+        )
     theses = await crud.list_theses(
         session, ticker=ticker, status=status, limit=limit, offset=offset,
+        before=(before, before_id) if before is not None else None,
     )
     return ThesisListResponse(
         theses=[ThesisListItem.model_validate(t) for t in theses],
@@ -582,7 +643,7 @@ async def change_feed(
     ticker: str,
     since: str = Query(..., description="ISO date string, e.g. 2026-01-01"),
     session: AsyncSession = Depends(get_session),
-) -> ChangeFeedResponse:
+) -> Response:
     """
     On-demand change detection: new SEC filings, insider transactions,
     and KPI threshold proximity since the given date.
@@ -596,7 +657,8 @@ async def change_feed(
         )
 
     try:
-        return await detect_changes(ticker, since_date, session=session)
+        feed = await detect_changes(ticker, since_date, session=session)
     except Exception as exc:
         logging.getLogger(__name__).error("Change feed failed: %s", exc, exc_info=True)
         raise HTTPException(status_code=502, detail=str(exc))
+    return _json_response(feed)
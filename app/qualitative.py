@@ -17,7 +17,7 @@ from typing import Any
 
 import anthropic
 
-from app.config import settings
+from app.config import get_settings
 from app.data import (
     DataResult,
     SourceMeta,
@@ -182,6 +182,33 @@ def _check_growth_contradiction(flag: RedFlag) -> str | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Shared Anthropic client
+# ---------------------------------------------------------------------------
+
+# Engines are built per request in places (thesis compile, KPI extraction);
+# they all share one client so its connection pool and TLS sessions to the
+# API stay warm instead of being rebuilt each time.  Settings are loaded once
+# per process, so the client never has to be rebuilt for a new API key.
+_anthropic: anthropic.AsyncAnthropic | None = None
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    """Return the process-wide Anthropic client, created on first use."""
+    global _anthropic
+    if _anthropic is None:
+        _anthropic = anthropic.AsyncAnthropic(api_key=get_settings().anthropic_api_key)
+    return _anthropic
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic client (app shutdown)."""
+    global _anthropic
+    if _anthropic is not None:
+        await _anthropic.close()
+        _anthropic = None
+
+
 # ---------------------------------------------------------------------------
 # QualitativeEngine
 # ---------------------------------------------------------------------------
@@ -196,12 +223,13 @@ class QualitativeEngine:
     """
 
     def __init__(self) -> None:
+        settings = get_settings()
         if not settings.anthropic_api_key:
             raise ValueError(
                 "ANTHROPIC_API_KEY is required for the qualitative engine. "
                 "Set it in .env."
             )
-        self.client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client()
 
     # -------------------------------------------------------------------
     # Evidence builder
@@ -456,9 +484,9 @@ class QualitativeEngine:
             raise ValueError(f"No {form_types} filings found for {ticker}")
 
         filing = filings_result.data[0]
-        form_type = filing["form_type"]
-        accession = filing["accession_number"]
-        cik = filing["cik"]
+        form_type = filing.form_type
+        accession = filing.accession_number
+        cik = filing.cik
 
         evidence = await self.build_evidence_for_claims(
             ticker, claims, form_type, accession, cik,
@@ -10,12 +10,12 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Any
 
 from scipy.optimize import brentq
 
-from app.config import settings
+from app.config import get_settings
 from app.data import (
     DataResult,
     SourceMeta,
@@ -118,7 +118,7 @@ class QuantOutput:
     sector_kpis: dict[str, KPIResult]
     quality_scores: dict[str, ScoreResult]
     excluded_scores: dict[str, str]
-    computed_at: datetime = field(default_factory=datetime.utcnow)
+    computed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # ---------------------------------------------------------------------------
@@ -1062,7 +1062,7 @@ class QuantEngine:
             consensus_source = (
                 f"FMP consensus ({analyst_count or '?'} analysts, FY{fiscal_year or '?'})"
             )
-        elif settings.fmp_api_key:
+        elif get_settings().fmp_api_key:
             consensus_source = "not available"
         else:
             consensus_source = "FMP_API_KEY not configured"
@@ -9,6 +9,7 @@ The engine knows HOW.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -53,6 +54,11 @@ class SectorTemplate:
     exclude_scores: list[str]
     exclude_reason: dict[str, str] = field(default_factory=dict)
 
+    @cached_property
+    def kpi_family_map(self) -> dict[str, str]:
+        """KPI id → kpi_family, built once per template instance."""
+        return {k.id: k.kpi_family for k in self.primary_kpis}
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SaaS / Cloud Software
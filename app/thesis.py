@@ -15,13 +15,11 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date
 from typing import Any
 
-import anthropic
-
-from app.brief import DecisionBriefResponse, generate_brief
-from app.config import settings
+from app.brief import DecisionBriefResponse, generate_brief, utc_now_iso
+from app.config import get_settings
 from app.coverage import DriverCoverage, compute_driver_coverage, coverage_to_dict
 from app.data import (
     SourceMeta,
@@ -29,14 +27,16 @@ from app.data import (
     get_company_submissions,
     get_filing_text,
 )
-from app.flow import FlowEngine, FlowOutput
+from app.engines import get_flow_engine, get_qualitative_engine, get_quant_engine
+from app.flow import FlowOutput
 from app.qualitative import (
     ClaimEvidence,
     FilingQueryResult,
     QualitativeEngine,
     RedFlagReport,
+    get_anthropic_client,
 )
-from app.quant import QuantEngine, QuantOutput
+from app.quant import QuantOutput
 from app.templates import SECTOR_TEMPLATES, SectorTemplate, get_template
 
 logger = logging.getLogger(__name__)
@@ -271,9 +271,10 @@ class ThesisCompiler:
     """
 
     def __init__(self) -> None:
+        settings = get_settings()
         if not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY is required for the thesis compiler.")
-        self.client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client()
 
     async def compile(
         self,
@@ -367,7 +368,7 @@ class ThesisCompiler:
                 ticker=ticker, direction=direction, thesis_text=thesis_text,
                 sector=template.sector, sector_display_name=template.display_name,
                 claims=[], kill_criteria=[], catalysts=[],
-                generated_at=datetime.utcnow().isoformat() + "Z",
+                generated_at=utc_now_iso(),
             )
 
         # Build claims with current KPI values + family
@@ -446,7 +447,7 @@ class ThesisCompiler:
             claims=claims,
             kill_criteria=kill_criteria,
             catalysts=catalysts,
-            generated_at=datetime.utcnow().isoformat() + "Z",
+            generated_at=utc_now_iso(),
             variant=raw.get("variant", ""),
             mechanism=raw.get("mechanism", ""),
             disconfirming=raw.get("disconfirming", []),
@@ -469,9 +470,10 @@ class StressTest:
     """
 
     def __init__(self) -> None:
+        settings = get_settings()
         if not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY is required for stress tests.")
-        self.client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client()
 
     async def run(
         self,
@@ -545,7 +547,7 @@ class StressTest:
                 ticker=ticker, thesis_summary=draft.thesis_text,
                 circular_reasoning=[], already_priced_in="Analysis failed",
                 falsification_tests=[], missing_disconfirming=[],
-                pm_questions=[], generated_at=datetime.utcnow().isoformat() + "Z",
+                pm_questions=[], generated_at=utc_now_iso(),
             )
 
         return StressTestResult(
@@ -556,7 +558,7 @@ class StressTest:
             falsification_tests=raw.get("falsification_tests", []),
             missing_disconfirming=raw.get("missing_disconfirming", []),
             pm_questions=raw.get("pm_questions", []),
-            generated_at=datetime.utcnow().isoformat() + "Z",
+            generated_at=utc_now_iso(),
         )
 
 
@@ -597,14 +599,14 @@ class CommandRouter:
     """
 
     def __init__(self) -> None:
-        self._quant = QuantEngine()
-        self._flow = FlowEngine()
+        self._quant = get_quant_engine()
+        self._flow = get_flow_engine()
         self._qual: QualitativeEngine | None = None
         self._compiler: ThesisCompiler | None = None
         self._stress: StressTest | None = None
 
-        if settings.anthropic_api_key:
-            self._qual = QualitativeEngine()
+        if get_settings().anthropic_api_key:
+            self._qual = get_qualitative_engine()
             self._compiler = ThesisCompiler()
             self._stress = StressTest()
 
@@ -763,7 +765,7 @@ class CommandRouter:
             claims=[],
             kill_criteria=[],
             catalysts=[],
-            generated_at=datetime.utcnow().isoformat() + "Z",
+            generated_at=utc_now_iso(),
         )
 
         result = await self._stress.run(ticker, draft, quant_output, flow_output)
@@ -791,14 +793,14 @@ class CommandRouter:
 
         filing = filings.data[0]
         result = await self._qual.targeted_filing_query(
-            ticker, query, filing["form_type"],
-            filing["accession_number"], filing["cik"],
+            ticker, query, filing.form_type,
+            filing.accession_number, filing.cik,
         )
 
         return {
             "ticker": ticker,
             "query": query,
-            "filing": f"{filing['form_type']} ({filing['filing_date']})",
+            "filing": f"{filing.form_type} ({filing.filing_date})",
             "query_answered": result.query_answered,
             "passages": [
                 {
@@ -836,8 +838,8 @@ class CommandRouter:
         claims = [{"id": f"{ticker}-Q1", "statement": claim_text, "kpi": ""}]
 
         evidence = await self._qual.build_evidence_for_claims(
-            ticker, claims, filing["form_type"],
-            filing["accession_number"], filing["cik"],
+            ticker, claims, filing.form_type,
+            filing.accession_number, filing.cik,
         )
 
         results = []
@@ -859,7 +861,7 @@ class CommandRouter:
         return {
             "ticker": ticker,
             "claim": claim_text,
-            "filing": f"{filing['form_type']} ({filing['filing_date']})",
+            "filing": f"{filing.form_type} ({filing.filing_date})",
             "evidence": results,
         }
 
@@ -934,6 +936,10 @@ def _evaluate_claim_status(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Simple comparison operators → breach direction (-1: breach below, +1: above)
+_KC_BREACH_DIRECTION: dict[str, int] = {"<": -1, "<=": -1, ">": 1, ">=": 1}
+
+
 def _evaluate_kill_criterion(
     current_value: float | None,
     threshold: float,
@@ -950,28 +956,24 @@ def _evaluate_kill_criterion(
         return "ok", None
 
     if threshold == 0:
-        distance = current_value  # avoid division by zero
-        distance_pct = None
+        distance_pct = None  # avoid division by zero
     else:
         distance_pct = abs(current_value - threshold) / abs(threshold) * 100
 
+    direction = _KC_BREACH_DIRECTION.get(operator)
+    if direction is None:
+        # Complex operators (e.g., "qoq_decline >") — default to ok
+        return "ok", distance_pct
+
     # Check breach
-    if operator in ("<", "<="):
-        if current_value < threshold:
-            return "breach", 0.0
-        if distance_pct is not None and distance_pct < 20:
-            return "watch", round(distance_pct, 1)
-        return "ok", round(distance_pct, 1) if distance_pct is not None else None
-
-    if operator in (">", ">="):
-        if current_value > threshold:
-            return "breach", 0.0
-        if distance_pct is not None and distance_pct < 20:
-            return "watch", round(distance_pct, 1)
-        return "ok", round(distance_pct, 1) if distance_pct is not None else None
-
-    # Complex operators (e.g., "qoq_decline >") — default to ok
-    return "ok", distance_pct
+    breached = current_value < threshold if direction < 0 else current_value > threshold
+    if breached:
+        return "breach", 0.0
+    if distance_pct is None:
+        return "ok", None
+    if distance_pct < 20:
+        return "watch", round(distance_pct, 1)
+    return "ok", round(distance_pct, 1)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
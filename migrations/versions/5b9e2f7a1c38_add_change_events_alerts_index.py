@@ -0,0 +1,31 @@
+"""add change_events alerts index — latest watch/breach events per ticker
+
+Revision ID: 5b9e2f7a1c38
+Revises: c71d4e0b8a25
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9e2f7a1c38'
+down_revision: Union[str, Sequence[str], None] = 'c71d4e0b8a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_change_events_alerts',
+        'change_events',
+        ['ticker', sa.text('timestamp DESC')],
+        postgresql_where=sa.text("severity IN ('watch', 'breach')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_change_events_alerts', table_name='change_events')
@@ -0,0 +1,38 @@
+"""add server defaults — status and flag columns default in the database too
+
+Revision ID: 9d4c6a0e2b57
+Revises: 5b9e2f7a1c38
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c6a0e2b57'
+down_revision: Union[str, Sequence[str], None] = '5b9e2f7a1c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, server default); claims.kpi_family got its default in a3f8b1d9c742
+_DEFAULTS = (
+    ('theses', 'status', sa.text("'draft'")),
+    ('claims', 'status', sa.text("'supported'")),
+    ('kill_criteria', 'status', sa.text("'ok'")),
+    ('change_events', 'interpretation_is_fact', sa.false()),
+    ('catalysts', 'occurred', sa.false()),
+)
+
+
+def upgrade() -> None:
+    for table, column, default in _DEFAULTS:
+        op.alter_column(table, column, server_default=default)
+
+
+def downgrade() -> None:
+    for table, column, _ in _DEFAULTS:
+        op.alter_column(table, column, server_default=None)
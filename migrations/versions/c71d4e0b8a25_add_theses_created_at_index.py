@@ -0,0 +1,28 @@
+"""add theses (created_at, id) index — backs list_theses ordering and keyset cursor
+
+Revision ID: c71d4e0b8a25
+Revises: a3f8b1d9c742
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71d4e0b8a25'
+down_revision: Union[str, Sequence[str], None] = 'a3f8b1d9c742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_theses_created_at', 'theses', [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_theses_created_at', table_name='theses')
@@ -0,0 +1,65 @@
+"""Brief serialization helpers — constructed models still match their schemas."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from app import brief
+from app.data import SourceMeta
+from app.qualitative import RedFlag, RedFlagReport
+from app.quant import EVBuild, EVComponent, KPIResult, MarketImplied, TrendPoint
+from app.templates import get_template
+
+SRC = SourceMeta("10-K", "ACME", filing_date=date(2026, 2, 1), accession_number="0001-26-1")
+
+
+def _ev() -> EVBuild:
+    parts = [EVComponent(label, value, SRC) for label, value in
+             (("Market cap", 100.0), ("Total debt", 20.0), ("Cash", 5.0))]
+    return EVBuild(*parts, enterprise_value=115.0, components=parts, summary="100 + 20 - 5")
+
+
+def _round_trip(model):
+    # Re-validating the dumped JSON proves the unvalidated model was schema-correct
+    return type(model).model_validate_json(model.model_dump_json())
+
+
+def test_ev_build_round_trips():
+    model = brief._serialize_ev(_ev())
+
+    assert isinstance(model, brief.EVBuildResponse)
+    assert _round_trip(model) == model
+    assert model.market_cap.source.filing_date == "2026-02-01"
+
+
+def test_implied_nulls_unsolvable_values():
+    mi = MarketImplied(
+        implied_fcf_growth_10yr=float("nan"), wacc=0.086, wacc_build="rf + beta x ERP",
+        fcf_used=10.0, fcf_computation="FCF = 12 - 2", ocf_used=12.0, ocf_source=SRC,
+        capex_used=2.0, capex_source=SRC, fcf_source=SRC, terminal_growth=0.025,
+        ev_used=115.0, sensitivity={"wacc +1%": float("inf"), "wacc -1%": 0.04},
+    )
+    model = brief._serialize_implied(mi)
+
+    assert model.implied_fcf_growth_10yr is None
+    assert model.sensitivity == {"wacc +1%": None, "wacc -1%": 0.04}
+    assert _round_trip(model) == model
+
+
+def test_kpis_and_red_flags_round_trip():
+    kpi = KPIResult(
+        "nrr", "Net revenue retention", 118.0, "%", "FY2025",
+        trend=[TrendPoint("Q4 FY2025", 118.0)], source=SRC,
+    )
+    template = get_template("saas")
+    (kpi_model,) = brief._serialize_kpis({"nrr": kpi}, template)
+    report = brief._serialize_red_flags(RedFlagReport(
+        red_flags=[RedFlag("Going concern", "high", "Item 7", None, True, "...", "...", SRC)],
+        clean_areas=["revenue recognition"], filing_source=SRC,
+    ))
+
+    assert isinstance(kpi_model, brief.KPIResponse)
+    assert _round_trip(kpi_model) == kpi_model
+    assert _round_trip(report) == report
+    assert json.loads(report.model_dump_json())["red_flags"][0]["page"] is None
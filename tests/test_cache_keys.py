@@ -0,0 +1,43 @@
+"""Ticker-scoped cache keys in app.data are case-insensitive."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import data
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    for cache in data._TICKER_CACHES:
+        cache.clear()
+    yield
+    for cache in data._TICKER_CACHES:
+        cache.clear()
+
+
+async def test_ticker_case_shares_one_entry(monkeypatch):
+    fetched = []
+
+    async def fake_fetch(ticker, key):
+        fetched.append(key)
+        result = data.DataResult(data={}, source=data.SourceMeta("fundamental", ticker))
+        data._fundamentals_cache[key] = result
+        return result
+
+    monkeypatch.setattr(data, "_fetch_fundamentals", fake_fetch)
+    first = await data.get_fundamentals("aapl")
+    second = await data.get_fundamentals("AAPL")
+
+    assert first is second
+    assert fetched == [("fundamentals", "AAPL")]
+
+
+def test_invalidate_ticker_drops_every_entry_for_it():
+    data._cache[("filings", "AAPL", None, 40)] = object()
+    data._cache[("13f", "AAPL", 20)] = object()
+    data._fundamentals_cache[("fundamentals", "AAPL")] = object()
+    data._cache[("filings", "MSFT", None, 40)] = object()
+
+    assert data.invalidate_ticker("aapl") == 3
+    assert list(data._cache.keys()) == [("filings", "MSFT", None, 40)]
@@ -0,0 +1,111 @@
+"""app.changes.detect_changes — concurrent checks, merge order, shared submissions."""
+
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app import changes
+from app.data import DataResult, FilingRow, SourceMeta
+
+_SRC = SourceMeta(source_type="test", filer="ACME")
+
+
+def _filing(form_type: str, filing_date: str) -> FilingRow:
+    return FilingRow(
+        form_type=form_type, filing_date=filing_date, accession_number=f"acc-{filing_date}",
+        primary_document="doc.htm", url="https://www.sec.gov/doc.htm", cik="0000000001",
+    )
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = {"submissions": 0, "sector_meta": []}
+    sub_meta = {"sic": "7372", "sic_description": "Prepackaged Software", "sector_key": "saas"}
+
+    async def get_company_filings(ticker, form_types=None, limit=40):
+        # Newest first, as EDGAR returns them
+        return DataResult(data=[
+            _filing("8-K", "2026-03-05"), _filing("EFFECT", "2026-02-01"),
+            _filing("10-K", "2025-12-01"),
+        ], source=_SRC)
+
+    async def get_insider_details(ticker, limit=20):
+        return DataResult(data=[
+            {"transaction_date": "2026-02-20", "transaction_code": "P", "owner_name": "CEO",
+             "shares": 1000, "value": 50_000},
+            {"transaction_date": "2025-11-01", "transaction_code": "S", "owner_name": "CFO"},
+        ], source=_SRC)
+
+    async def get_company_submissions(ticker):
+        calls["submissions"] += 1
+        return DataResult(data=sub_meta, source=_SRC)
+
+    async def detect_sector(ticker, sub_meta=None):
+        calls["sector_meta"].append(sub_meta)
+        return "saas", SimpleNamespace(), sub_meta
+
+    monkeypatch.setattr(changes, "get_company_filings", get_company_filings)
+    monkeypatch.setattr(changes, "get_insider_details", get_insider_details)
+    monkeypatch.setattr(changes, "get_company_submissions", get_company_submissions)
+    monkeypatch.setattr(changes, "detect_sector", detect_sector)
+    calls["sub_meta"] = sub_meta
+    return calls
+
+
+def _with_monitoring_thesis(monkeypatch, kpi_value: float):
+    kc = SimpleNamespace(
+        id="kc-1", description="NRR floor", metric="nrr", operator="<", threshold=100,
+        status="ok",
+    )
+    thesis = SimpleNamespace(id="t-1", kill_criteria=[kc])
+
+    async def list_theses(session, **kwargs):
+        return [thesis]
+
+    async def get_theses_by_ids(session, ids):
+        return [thesis]
+
+    class _Quant:
+        async def analyze(self, ticker, template):
+            kpi = SimpleNamespace(value=kpi_value, period="FY2025")
+            return SimpleNamespace(sector_kpis={"nrr": kpi})
+
+    monkeypatch.setattr(changes.crud, "list_theses", list_theses)
+    monkeypatch.setattr(changes.crud, "get_theses_by_ids", get_theses_by_ids)
+    monkeypatch.setattr(changes, "get_quant_engine", lambda: _Quant())
+
+
+async def test_events_are_merged_newest_first(upstream):
+    feed = await changes.detect_changes("acme", date(2026, 1, 1))
+
+    assert feed.ticker == "ACME"
+    assert [e.timestamp[:10] for e in feed.events] == ["2026-03-05", "2026-02-20", "2026-02-01"]
+    assert [e.severity for e in feed.events] == ["watch", "watch", "info"]
+    assert feed.event_count == 3
+    # No session: the KPI check and its submissions lookup are skipped
+    assert upstream["submissions"] == 0
+
+
+async def test_failed_check_is_dropped(upstream, monkeypatch):
+    async def broken(*args, **kwargs):
+        raise RuntimeError("EDGAR down")
+
+    monkeypatch.setattr(changes, "_check_insider_transactions", broken)
+    feed = await changes.detect_changes("ACME", date(2026, 1, 1))
+    assert [e.event_type for e in feed.events] == ["new_filing", "new_filing"]
+
+
+async def test_kpi_check_reuses_the_fetched_submissions(upstream, monkeypatch):
+    _with_monitoring_thesis(monkeypatch, kpi_value=90.0)
+    feed = await changes.detect_changes("ACME", date(2026, 1, 1), session=object())
+
+    assert upstream["submissions"] == 1
+    assert upstream["sector_meta"] == [upstream["sub_meta"]]
+    kpi_events = [e for e in feed.events if e.event_type == "kpi_threshold"]
+    assert len(kpi_events) == 1
+    assert kpi_events[0].severity == "breach"
+    assert kpi_events[0].kill_status_change == "ok -> breach"
+    assert kpi_events[0].timestamp == feed.checked_at
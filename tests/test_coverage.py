@@ -0,0 +1,137 @@
+"""compute_coverage_from_claims — output parity with the unmemoized original."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.coverage import compute_coverage_from_claims
+
+_DIMENSIONS = ("revenue_drivers", "retention", "pricing", "margin", "competition")
+
+
+def _claim(kpi_id, value=None, yoy=None, family="lagging"):
+    # Numeric columns come back from the ORM as Decimal
+    return SimpleNamespace(
+        kpi_id=kpi_id, current_value=value, yoy_delta=yoy, qoq_delta=None, kpi_family=family,
+    )
+
+
+def _summary(claims) -> dict:
+    cov = compute_coverage_from_claims(claims)
+    out = {"score": cov.score}
+    for name in _DIMENSIONS:
+        dim = getattr(cov, name)
+        out[name] = (dim.status, dim.reasons, dim.supporting_artifacts)
+    return out
+
+
+# Expected values were produced by the pre-memoization implementation.
+
+
+def test_fully_covered_thesis():
+    claims = [
+        _claim("revenue_growth", Decimal("12.5"), Decimal("1.2")),
+        _claim("rpo_growth", Decimal("20"), family="leading"),
+        _claim("deferred_rev_growth", Decimal("8")),
+        _claim("nrr", Decimal("118")),
+        _claim("subscription_mix", Decimal("0.9")),
+        _claim("gross_margin", Decimal("75.25"), Decimal("-0.5")),
+        _claim("operating_margin", Decimal("10")),
+        _claim("r_and_d_intensity", Decimal("22")),
+        _claim("sm_revenue", Decimal("30")),
+        _claim("fcf_margin", Decimal("25")),
+        _claim("revenue_growth", Decimal("99")),  # duplicate KPI — first claim wins
+    ]
+    assert _summary(claims) == {
+        "score": 5,
+        "revenue_drivers": (
+            "covered",
+            [
+                "revenue_growth: 12.50, +1.2pp YoY", "rpo_growth: 20.00",
+                "deferred_rev_growth: 8.00",
+            ],
+            ["revenue_growth", "rpo_growth", "deferred_rev_growth"],
+        ),
+        "retention": (
+            "covered",
+            ["nrr: 118.00", "deferred_rev_growth: 8.00"],
+            ["nrr", "deferred_rev_growth"],
+        ),
+        "pricing": (
+            "covered",
+            ["subscription_mix: 0.90", "gross_margin: 75.25, -0.5pp YoY"],
+            ["subscription_mix", "gross_margin"],
+        ),
+        "margin": (
+            "covered",
+            [
+                "operating_margin: 10.00", "r_and_d_intensity: 22.00",
+                "sm_revenue: 30.00", "fcf_margin: 25.00",
+            ],
+            ["operating_margin", "r_and_d_intensity", "sm_revenue", "fcf_margin"],
+        ),
+        "competition": (
+            "covered", ["Leading indicator claim on: rpo_growth"], ["rpo_growth"],
+        ),
+    }
+
+
+def test_partial_thesis():
+    claims = [
+        _claim("revenue_growth"),
+        _claim("nrr", Decimal("101.5"), Decimal("2")),
+        _claim("gross_margin"),
+        _claim("custom_kpi", Decimal("1")),
+    ]
+    assert _summary(claims) == {
+        "score": 0,
+        "revenue_drivers": (
+            "missing",
+            [
+                "revenue_growth: no data available",
+                "rpo_growth: not computed for this sector",
+                "deferred_rev_growth: not computed for this sector",
+            ],
+            [],
+        ),
+        "retention": (
+            "partial",
+            ["nrr: 101.50, +2.0pp YoY", "deferred_rev_growth: not computed for this sector"],
+            ["nrr"],
+        ),
+        "pricing": (
+            "missing",
+            ["subscription_mix: not computed for this sector", "gross_margin: no data available"],
+            [],
+        ),
+        "margin": (
+            "missing",
+            [
+                "operating_margin: not computed for this sector",
+                "r_and_d_intensity: not computed for this sector",
+                "sm_revenue: not computed for this sector",
+                "fcf_margin: not computed for this sector",
+            ],
+            [],
+        ),
+        "competition": ("missing", ["No claims reference leading indicators"], []),
+    }
+
+
+def test_no_claims():
+    summary = _summary([])
+    assert summary["score"] == 0
+    assert all(summary[name][0] == "missing" for name in _DIMENSIONS)
+    assert summary["competition"][1] == ["No claims reference leading indicators"]
+
+
+def test_memoized_results_are_not_shared():
+    claims = [_claim("nrr", Decimal("118"), family="leading")]
+    first = compute_coverage_from_claims(claims)
+    first.score = 99
+    first.retention.reasons.append("mutated")
+
+    second = compute_coverage_from_claims(claims)
+    assert second.score == 1
+    assert "mutated" not in second.retention.reasons
@@ -0,0 +1,128 @@
+"""Statement shape and state guards in app.crud, against a recording session."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app import crud
+
+THESIS_ID = uuid.UUID("00000000-0000-0000-0000-0000000000aa")
+
+
+class _Result:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def scalars(self) -> _Result:
+        return self
+
+    def all(self) -> list:
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class _Session:
+    """Records executed statements and answers them from a queue of row lists."""
+
+    def __init__(self, *results: list) -> None:
+        self._results = list(results)
+        self.statements: list = []
+
+    async def execute(self, stmt, *args, **kwargs) -> _Result:
+        self.statements.append(stmt)
+        return _Result(self._results.pop(0))
+
+
+def _sql(stmt) -> tuple[str, dict]:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+# ---------------------------------------------------------------------------
+# list_theses
+# ---------------------------------------------------------------------------
+
+
+async def test_list_theses_keyset_replaces_offset():
+    created_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    session = _Session([])
+    await crud.list_theses(session, before=(created_at, THESIS_ID), offset=40, limit=10)
+
+    sql, params = _sql(session.statements[0])
+    # Row comparison, so theses sharing the cursor's created_at are not skipped
+    assert "(theses.created_at, theses.id) < (" in sql
+    assert "OFFSET" not in sql
+    assert "ORDER BY theses.created_at DESC, theses.id DESC" in sql
+    assert created_at in params.values()
+    assert THESIS_ID in params.values()
+
+
+async def test_list_theses_without_cursor_pages_by_offset():
+    session = _Session([])
+    await crud.list_theses(session, ticker="aapl", offset=40, limit=10)
+
+    sql, params = _sql(session.statements[0])
+    assert "OFFSET" in sql
+    assert "theses.created_at, theses.id) < " not in sql
+    assert "AAPL" in params.values()
+
+
+async def test_list_theses_returns_a_list():
+    rows = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+    result = await crud.list_theses(_Session(rows))
+    assert isinstance(result, list)
+    assert result == rows
+
+
+# ---------------------------------------------------------------------------
+# lock_thesis / close_thesis
+# ---------------------------------------------------------------------------
+
+
+async def test_lock_is_a_single_guarded_update():
+    thesis = SimpleNamespace(id=THESIS_ID, status="monitoring")
+    session = _Session([thesis])
+
+    assert await crud.lock_thesis(session, THESIS_ID) is thesis
+    assert len(session.statements) == 1
+    sql, params = _sql(session.statements[0])
+    assert sql.startswith("UPDATE theses SET status=")
+    assert "RETURNING" in sql
+    assert "draft" in params.values()
+
+
+@pytest.mark.parametrize(
+    ("current", "message"),
+    [("monitoring", "must be 'draft'"), (None, "not found")],
+)
+async def test_lock_rejects_non_draft(current, message):
+    session = _Session([], [current] if current else [])
+    with pytest.raises(ValueError, match=message):
+        await crud.lock_thesis(session, THESIS_ID)
+
+
+async def test_close_guards_terminal_statuses():
+    thesis = SimpleNamespace(id=THESIS_ID, status="closed")
+    session = _Session([thesis])
+
+    assert await crud.close_thesis(session, THESIS_ID, "done", close_price=10.0) is thesis
+    sql, params = _sql(session.statements[0])
+    assert "NOT IN" in sql
+    assert ["closed", "killed"] in params.values()
+
+
+@pytest.mark.parametrize(
+    ("current", "message"),
+    [("killed", "already 'killed'"), ("closed", "already 'closed'"), (None, "not found")],
+)
+async def test_close_rejects_terminal(current, message):
+    session = _Session([], [current] if current else [])
+    with pytest.raises(ValueError, match=message):
+        await crud.close_thesis(session, THESIS_ID, "done")
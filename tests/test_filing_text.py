@@ -0,0 +1,52 @@
+"""Filing HTML → plain text in app.data — both tokenizers, fed whole or in chunks."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import data
+
+HTML = (
+    "<html><head><title>10-K</title><style>p {color: red}</style></head><body>"
+    "<div>Item 7.   Management&#8217;s Discussion</div>"
+    "<p>Revenue grew<br>12% year over year.</p>"
+    "<script>var x = 1;</script>"
+    "<table><tr><td>Revenue</td><td>$1,000</td></tr></table>"
+    "<p><ix:nonNumeric name='dei:Risk'>Risk   factors</ix:nonNumeric></p>"
+    "</body></html>"
+)
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(data, "_lxml_etree", None)
+    elif data._lxml_etree is None:
+        pytest.skip("lxml not installed")
+    return request.param
+
+
+def test_strips_markup(backend):
+    assert data._strip_html(HTML) == (
+        "Item 7. Management’s Discussion\n\n"
+        "Revenue grew\n12% year over year.\n\n"
+        "Revenue $1,000\n\n"  # cells are tab-separated, then folded to spaces
+        "Risk factors"
+    )
+
+
+def test_br_is_a_single_line_break(backend):
+    assert data._strip_html("<p>one<br>two<br/>three</p>") == "one\ntwo\nthree"
+
+
+def test_chunked_feed_matches_whole_feed(backend):
+    raw = HTML.replace("Risk", "Risk é").encode("utf-8")
+    parser = data._FilingTextParser()
+    for i in range(0, len(raw), 7):  # splits tags, entities and the 2-byte é
+        parser.feed(raw[i:i + 7])
+
+    assert parser.close() == data._strip_html(raw.decode("utf-8"))
+
+
+def test_empty_input(backend):
+    assert data._FilingTextParser().close() == ""
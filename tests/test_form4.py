@@ -0,0 +1,111 @@
+"""Form 4 XML parsing in app.data — the lxml path and the stdlib fallback."""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app import data
+
+FORM4 = b"""<?xml version="1.0"?>
+<ownershipDocument>
+  <reportingOwner>
+    <reportingOwnerId><rptOwnerName>Doe Jane</rptOwnerName></reportingOwnerId>
+    <reportingOwnerRelationship>
+      <isDirector>0</isDirector><isOfficer>1</isOfficer>
+      <officerTitle>Chief Financial Officer</officerTitle>
+    </reportingOwnerRelationship>
+  </reportingOwner>
+  <nonDerivativeTable>
+    <nonDerivativeTransaction>
+      <transactionDate><value>2026-03-02</value></transactionDate>
+      <transactionCoding><transactionCode>S</transactionCode></transactionCoding>
+      <transactionAmounts>
+        <transactionShares><value>1000</value></transactionShares>
+        <transactionPricePerShare><value>12.5</value></transactionPricePerShare>
+        <transactionAcquiredDisposedCode><value>D</value></transactionAcquiredDisposedCode>
+      </transactionAmounts>
+      <postTransactionAmounts>
+        <sharesOwnedFollowingTransaction><value>9000</value></sharesOwnedFollowingTransaction>
+      </postTransactionAmounts>
+    </nonDerivativeTransaction>
+  </nonDerivativeTable>
+  <footnotes>
+    <footnote id="F1">Sold under a Rule 10b5-1 trading plan.</footnote>
+  </footnotes>
+</ownershipDocument>
+"""
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(data, "_lxml_etree", None)
+        monkeypatch.setattr(data, "_FORM4_XML_PARSER", None)
+        monkeypatch.setattr(data, "_XML_PARSE_ERRORS", (ET.ParseError,))
+    elif data._lxml_etree is None:
+        pytest.skip("lxml not installed")
+    return request.param
+
+
+def _parse(xml: bytes) -> list[dict]:
+    return data._parse_form4_xml(xml, "0001-26-000001", "2026-03-04", "320193")
+
+
+def test_parses_a_sale(backend):
+    (txn,) = _parse(FORM4)
+
+    assert txn["owner_name"] == "Doe Jane"
+    assert txn["owner_title"] == "Chief Financial Officer"
+    assert (txn["is_director"], txn["is_officer"]) == (False, True)
+    assert txn["transaction_date"] == "2026-03-02"
+    assert (txn["transaction_code"], txn["acquired_or_disposed"]) == ("S", "D")
+    assert (txn["shares"], txn["price_per_share"], txn["value"]) == (1000.0, 12.5, 12500.0)
+    assert txn["shares_owned_after"] == 9000.0
+    assert txn["is_10b5_1"] is True
+    assert txn["accession_number"] == "0001-26-000001"
+
+
+def test_missing_fields_fall_back(backend):
+    xml = FORM4.replace(b"<value>2026-03-02</value>", b"").replace(
+        b"<officerTitle>Chief Financial Officer</officerTitle>", b"",
+    )
+    (txn,) = _parse(xml)
+
+    assert txn["transaction_date"] == "2026-03-04"  # the filing date
+    assert txn["owner_title"] == ""
+
+
+def test_malformed_xml_yields_nothing(backend):
+    assert _parse(b"<ownershipDocument><reportingOwner>") == []
+
+
+def test_entities_are_not_expanded(tmp_path):
+    if data._lxml_etree is None:
+        pytest.skip("lxml not installed")
+    secret = tmp_path / "secret.txt"
+    secret.write_text("leaked")
+    xml = FORM4.replace(
+        b'<?xml version="1.0"?>',
+        f'<?xml version="1.0"?><!DOCTYPE d [<!ENTITY x SYSTEM "{secret.as_uri()}">]>'.encode(),
+    ).replace(b"Doe Jane", b"&x;")
+
+    txns = _parse(xml)
+    assert all("leaked" not in t["owner_name"] for t in txns)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("1000", 1000.0), ("12.5", 12.5), ("", None), ("1,000", None), ("n/a", None)],
+)
+def test_to_float(raw, expected):
+    assert data._to_float(raw) == expected
+
+
+def test_malformed_number_keeps_the_transaction(backend):
+    (txn,) = _parse(FORM4.replace(b"<value>1000</value>", b"<value>1,000</value>"))
+
+    assert txn["shares"] is None
+    assert txn["value"] is None
+    assert txn["price_per_share"] == 12.5
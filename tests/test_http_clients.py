@@ -0,0 +1,34 @@
+"""Shared HTTP clients in app.data — which upstream sees which headers."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import data
+from app.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_clients():
+    await data.close_http_client()
+    yield
+    await data.close_http_client()
+
+
+async def test_sec_client_identifies_with_the_sec_user_agent():
+    async with data._http_client() as client:
+        assert client.headers["user-agent"] == get_settings().sec_user_agent
+
+
+async def test_third_party_client_never_sends_the_sec_user_agent():
+    async with data._api_http_client() as api, data._http_client() as sec:
+        assert api is not sec
+        assert api.headers["user-agent"] != get_settings().sec_user_agent
+        assert api.cookies is not sec.cookies
+
+
+async def test_close_releases_every_pool():
+    async with data._api_http_client() as api, data._http_client() as sec:
+        pass
+    await data.close_http_client()
+    assert api.is_closed and sec.is_closed
@@ -0,0 +1,26 @@
+"""main._json_response — the direct pydantic-core bytes path."""
+
+from __future__ import annotations
+
+import json
+
+from app.brief import SourceMetaResponse
+from app.main import _json_response
+
+
+def test_emits_the_model_json_bytes():
+    model = SourceMetaResponse.model_construct(
+        source_type="10-K", filer="ACME", filing_date="2026-02-01", url="", description="",
+        section=None, accession_number="0000000001-26-000001",
+    )
+    resp = _json_response(model)
+
+    assert resp.media_type == "application/json"
+    assert resp.body == model.model_dump_json().encode()
+    assert json.loads(resp.body)["filing_date"] == "2026-02-01"
+
+
+def test_does_not_revalidate():
+    # Constructed models are trusted; serializing one never raises
+    model = SourceMetaResponse.model_construct(source_type="10-K", filer="ACME")
+    assert json.loads(_json_response(model).body)["filer"] == "ACME"
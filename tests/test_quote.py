@@ -0,0 +1,71 @@
+"""get_quote — racing the two Yahoo chart hosts."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app import data
+
+Q1, Q2 = data._YAHOO_QUOTE_HOSTS
+
+
+class _Yahoo:
+    """MockTransport handler: per host, a price (or an HTTP status) and a delay."""
+
+    def __init__(self, **hosts: tuple[float | int, float]) -> None:
+        self.hosts = {Q1: hosts["q1"], Q2: hosts["q2"]}
+        self.cancelled: list[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        answer, delay = self.hosts[request.url.host]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(request.url.host)
+            raise
+        if isinstance(answer, int):
+            return httpx.Response(answer)
+        meta = {"regularMarketPrice": answer, "currency": "USD"}
+        return httpx.Response(200, json={"chart": {"result": [{"meta": meta}]}})
+
+
+@pytest.fixture
+async def yahoo(monkeypatch):
+    async def install(upstream: _Yahoo) -> None:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        monkeypatch.setattr(data, "_yahoo_client", client)
+
+    data._quote_cache.clear()
+    yield install
+    data._quote_cache.clear()
+    await data.close_http_client()
+
+
+async def test_first_answer_wins_and_the_loser_is_cancelled(yahoo):
+    upstream = _Yahoo(q1=(101.0, 0), q2=(202.0, 5))
+    await yahoo(upstream)
+    result = await data.get_quote("acme")
+
+    assert result.data == {"price": 101.0, "currency": "USD"}
+    assert Q1 in result.source.description
+    await asyncio.sleep(0)
+    assert upstream.cancelled == [Q2]
+
+
+async def test_rate_limited_host_falls_through_to_the_other(yahoo):
+    await yahoo(_Yahoo(q1=(429, 0), q2=(202.0, 0.01)))
+    result = await data.get_quote("ACME")
+
+    assert result.data["price"] == 202.0
+    assert Q2 in result.source.description
+
+
+async def test_both_hosts_failing_yields_no_price(yahoo):
+    await yahoo(_Yahoo(q1=(429, 0), q2=(500, 0)))
+    result = await data.get_quote("ACME")
+
+    assert result.data == {"price": None, "currency": "USD"}
+    assert result.source.description == "Quote unavailable for ACME"
@@ -0,0 +1,112 @@
+"""Conditional GETs in app.data._get_revalidated — 200 / 304 and the disk tier."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from app import data
+
+URL = "https://data.sec.gov/submissions/CIK0000000001.json"
+
+
+class _Upstream:
+    """MockTransport handler: serves ``body`` under ``etag``, 304 on a match."""
+
+    def __init__(self, body: dict, etag: str | None = '"v1"') -> None:
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag is not None and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        headers = {"etag": self.etag} if self.etag is not None else {}
+        return httpx.Response(200, json=self.body, headers=headers)
+
+
+class _CountingParse:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, content: bytes) -> dict:
+        self.calls += 1
+        return json.loads(content)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, "_DISK_CACHE_DIR", tmp_path)
+    data._revalidate_cache.clear()
+    yield
+    data._revalidate_cache.clear()
+
+
+async def test_200_then_304_reuses_the_parsed_value():
+    upstream = _Upstream({"name": "ACME"})
+    parse = _CountingParse()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        first = await data._get_revalidated(client, URL, parse)
+        second = await data._get_revalidated(client, URL, parse)
+
+    assert first == second == {"name": "ACME"}
+    assert parse.calls == 1
+    assert "if-none-match" not in upstream.requests[0].headers
+    assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+
+
+async def test_changed_document_is_parsed_again():
+    upstream = _Upstream({"name": "ACME"})
+    parse = _CountingParse()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        await data._get_revalidated(client, URL, parse)
+        upstream.body, upstream.etag = {"name": "ACME Corp"}, '"v2"'
+        value = await data._get_revalidated(client, URL, parse)
+
+    assert value == {"name": "ACME Corp"}
+    assert parse.calls == 2
+
+
+async def test_response_without_validators_is_not_reused():
+    upstream = _Upstream({"name": "ACME"}, etag=None)
+    parse = _CountingParse()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        await data._get_revalidated(client, URL, parse)
+        await data._get_revalidated(client, URL, parse)
+
+    assert parse.calls == 2
+    assert all("if-none-match" not in r.headers for r in upstream.requests)
+
+
+async def test_persisted_entry_revalidates_after_restart():
+    upstream = _Upstream({"name": "ACME"})
+    parse = _CountingParse()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        await data._get_revalidated(client, URL, parse, schema="s1")
+        data._revalidate_cache.clear()  # a fresh process only has the disk entry
+        value = await data._get_revalidated(client, URL, parse, schema="s1")
+
+    assert value == {"name": "ACME"}
+    assert parse.calls == 1
+    assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+
+
+async def test_schema_change_ignores_the_persisted_entry():
+    upstream = _Upstream({"name": "ACME"})
+    parse = _CountingParse()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        await data._get_revalidated(client, URL, parse, schema="s1")
+        data._revalidate_cache.clear()
+        await data._get_revalidated(client, URL, parse, schema="s2")
+
+    assert parse.calls == 2
+    assert "if-none-match" not in upstream.requests[1].headers
+
+
+def test_schema_tags_track_the_kept_fields():
+    assert data._schema_tag(1, ("a", "b")) == data._schema_tag(1, ("a", "b"))
+    assert data._schema_tag(1, ("a", "b")) != data._schema_tag(1, ("a", "c"))
+    assert data._schema_tag(1, ("a", "b")) != data._schema_tag(2, ("a", "b"))
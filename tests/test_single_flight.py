@@ -0,0 +1,81 @@
+"""app.data._single_flight — request coalescing and negative caching."""
+
+from __future__ import annotations
+
+import asyncio
+import traceback
+
+import httpx
+import pytest
+
+from app import data
+
+
+@pytest.fixture(autouse=True)
+def _clear_tombstones():
+    data._negative_cache.clear()
+    yield
+    data._negative_cache.clear()
+
+
+class _Fetch:
+    def __init__(self, outcome) -> None:
+        self.outcome = outcome
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
+
+
+def _http_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://data.sec.gov/x.json")
+    return httpx.HTTPStatusError(
+        f"{status}", request=request, response=httpx.Response(status, request=request),
+    )
+
+
+async def test_concurrent_callers_share_one_fetch():
+    fetch = _Fetch({"ok": True})
+    results = await asyncio.gather(*(data._single_flight(("k",), fetch) for _ in range(10)))
+    assert fetch.calls == 1
+    assert all(r is results[0] for r in results)
+
+
+async def test_unknown_ticker_is_tombstoned_with_fresh_exceptions():
+    fetch = _Fetch(data.TickerNotFoundError("Ticker ZZZZ not found in SEC EDGAR"))
+    raised = []
+    for _ in range(3):
+        with pytest.raises(data.TickerNotFoundError, match="ZZZZ") as info:
+            await data._single_flight(("k",), fetch)
+        raised.append(info.value)
+
+    assert fetch.calls == 1
+    assert len({id(e) for e in raised}) == 3
+    # A re-raised shared instance would grow its traceback on every hit
+    assert len(traceback.extract_tb(raised[1].__traceback__)) == len(
+        traceback.extract_tb(raised[2].__traceback__)
+    )
+
+
+async def test_404_is_tombstoned():
+    fetch = _Fetch(_http_error(404))
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError) as info:
+            await data._single_flight(("k",), fetch)
+    assert fetch.calls == 1
+    assert info.value.response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "exc", [ValueError("bad data"), _http_error(503), httpx.ConnectError("down")],
+)
+async def test_other_failures_are_retried(exc):
+    fetch = _Fetch(exc)
+    for _ in range(2):
+        with pytest.raises(type(exc)):
+            await data._single_flight(("k",), fetch)
+    assert fetch.calls == 2